@@ -4,11 +4,13 @@ Output adapters for Artissist Logger Python client
 """
 
 from .base import LogAdapter
+from .batching import BatchingAdapter
 from .console import ConsoleAdapter
 from .file import FileAdapter
 
 __all__ = [
     "LogAdapter",
+    "BatchingAdapter",
     "ConsoleAdapter",
     "FileAdapter",
 ]
@@ -3,24 +3,82 @@
 Base adapter interface for Artissist Logger Python client
 """
 
+import json
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from collections.abc import Mapping
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
 
-from ..types import LogEntry
+from ..types import LogEntry, LogLevel
+
+try:
+    from orjson import OPT_APPEND_NEWLINE as _ORJSON_OPT
+    from orjson import dumps as _orjson_dumps
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    _orjson_dumps = None  # type: ignore
+    _ORJSON_OPT = 0
+
+
+def _encode_extra(value: Any) -> Any:
+    """Encode values that the JSON encoder does not handle natively"""
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def _dumps_line(value: Any) -> bytes:
+    """Serialize a log entry (or part of one) as one newline-ended line"""
+    if HAS_ORJSON:
+        return _orjson_dumps(value, default=_encode_extra, option=_ORJSON_OPT)
+    return (json.dumps(value, default=_encode_extra) + "\n").encode("utf-8")
+
+
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Padded level column, built once instead of ljust() per record
+_LEVEL_STR: Dict[LogLevel, str] = {
+    level: level.value.ljust(5) for level in LogLevel
+}
+
+# " <emoji>" prefixes already built; the emoji set is small and fixed
+_EMOJI_TAGS: Dict[str, str] = {}
 
 
 class LogAdapter(ABC):
     """Base class for log output adapters"""
 
+    # Structured adapters that ignore formatted_message can set this to
+    # False; the logger then skips format_message and passes ""
+    needs_formatting: bool = True
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize adapter with configuration"""
         self.config = config
+        # "[service]" tags already built for the services seen so far
+        self._service_tags: Dict[Optional[str], str] = {}
 
     @abstractmethod
     async def write(self, message: LogEntry, formatted_message: str):
         """Write formatted log message to output destination"""
         raise NotImplementedError
 
+    async def write_batch(self, entries: List[Tuple[LogEntry, str]]):
+        """Write several (message, formatted_message) pairs in order
+
+        Adapters that can coalesce output into fewer I/O calls should
+        override this; the default writes each entry individually.
+        """
+        for message, formatted_message in entries:
+            await self.write(message, formatted_message)
+
     @abstractmethod
     async def close(self):
         """Clean up adapter resources"""
@@ -33,41 +91,54 @@ class LogAdapter(ABC):
         emoji: Optional[str] = None,
     ) -> str:
         """Format log message for output"""
-        timestamp_str = "unknown"
-        if message.timestamp:
-            if isinstance(message.timestamp, str):
-                timestamp_str = message.timestamp
-            else:
-                timestamp_str = message.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-
-        level_str = "INFO"
-        if message.level:
-            level_str = message.level.value.ljust(5)
-        service = f"[{message.service or 'unknown'}]"
-
-        # Build message components
-        parts = [timestamp_str, level_str, service]
-
-        # Add emoji if enabled and available
+        timestamp = message.timestamp
+        if not timestamp:
+            timestamp_str = "unknown"
+        elif isinstance(timestamp, str):
+            timestamp_str = timestamp
+        else:
+            timestamp_str = timestamp.strftime(_TS_FMT)
+
+        level = message.level
+        level_str = _LEVEL_STR[level] if level else "INFO "
+
+        service_tag = self._service_tags.get(message.service)
+        if service_tag is None:
+            service_tag = f"[{message.service or 'unknown'}]"
+            self._service_tags[message.service] = service_tag
+
+        emoji_str = ""
         if include_emoji and emoji:
-            parts.append(emoji)
-
-        parts.append(message.message or "")
+            emoji_str = _EMOJI_TAGS.get(emoji, "")
+            if not emoji_str:
+                emoji_str = _EMOJI_TAGS[emoji] = f" {emoji}"
 
-        base_message = " ".join(parts)
+        base_message = (
+            f"{timestamp_str} {level_str} {service_tag}"
+            f"{emoji_str} {message.message or ''}"
+        )
 
         # Add context information if available
-        context_parts = []
-        if message.context and message.context.correlation_id:
-            context_parts.append(
-                f"correlation_id={message.context.correlation_id}"
+        context = message.context
+        if context is None:
+            return base_message
+
+        correlation_id = context.correlation_id
+        user_id = context.user_id
+        request_id = context.request_id
+        if not (correlation_id or user_id or request_id):
+            return base_message
+
+        # Single-field context (usually just correlation_id) needs no join
+        if correlation_id and not (user_id or request_id):
+            return f"{base_message} | correlation_id={correlation_id}"
+
+        return f"{base_message} | " + ", ".join(
+            f"{key}={value}"
+            for key, value in (
+                ("correlation_id", correlation_id),
+                ("user_id", user_id),
+                ("request_id", request_id),
             )
-        if message.context and message.context.user_id:
-            context_parts.append(f"user_id={message.context.user_id}")
-        if message.context and message.context.request_id:
-            context_parts.append(f"request_id={message.context.request_id}")
-
-        if context_parts:
-            base_message += f" | {', '.join(context_parts)}"
-
-        return base_message
+            if value
+        )
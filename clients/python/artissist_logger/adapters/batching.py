@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""
+Batching adapter wrapper for Artissist Logger Python client
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..types import LogEntry
+from .base import LogAdapter
+
+
+class BatchingAdapter(LogAdapter):
+    """Buffers writes and hands them to a delegate adapter in batches
+
+    A batch is flushed when it reaches ``batch_size`` entries or when
+    ``batch_timeout_us`` elapses after its first entry, whichever comes
+    first. Delegates that implement ``write_batch`` (such as FileAdapter)
+    then issue one I/O call per batch instead of one per log line.
+    """
+
+    def __init__(
+        self, delegate: LogAdapter, config: Optional[Dict[str, Any]] = None
+    ):
+        config = config or {}
+        super().__init__(config)
+        self.delegate = delegate
+        self.needs_formatting = delegate.needs_formatting
+        self.batch_size = config.get("batch_size", 32)
+        self.batch_timeout = config.get("batch_timeout_us", 100) / 1_000_000
+
+        self._buffer: List[Tuple[LogEntry, str]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional["asyncio.Future[None]"] = None
+        # Serializes delegate writes so batches land in submission order.
+        # Created on first flush: before Python 3.10 an asyncio.Lock binds
+        # to the loop that is current when it is constructed.
+        self._lock: Optional[asyncio.Lock] = None
+
+    def format_message(
+        self,
+        message: LogEntry,
+        include_emoji: bool = False,
+        emoji: Optional[str] = None,
+    ) -> str:
+        """Format using the delegate's formatting rules"""
+        return self.delegate.format_message(message, include_emoji, emoji)
+
+    async def write(self, message: LogEntry, formatted_message: str):
+        """Buffer the message, flushing when the batch is full"""
+        self._buffer.append((message, formatted_message))
+
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.batch_timeout, self._on_timeout
+            )
+
+    def _on_timeout(self):
+        """Flush a stale partial batch from the event loop"""
+        self._timer = None
+        self._flush_task = asyncio.ensure_future(self._flush_quietly())
+
+    async def _flush_quietly(self):
+        """Timer-driven flush; errors must not escape an unawaited task"""
+        try:
+            await self.flush()
+        except Exception:
+            # Ignore adapter errors to prevent logging failures
+            pass
+
+    async def flush(self):
+        """Write all buffered messages to the delegate"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._buffer:
+            return
+
+        batch, self._buffer = self._buffer, []
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            await self.delegate.write_batch(batch)
+
+    async def close(self):
+        """Flush pending messages and close the delegate"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        # A timer-driven flush may still be writing its batch
+        flush_task, self._flush_task = self._flush_task, None
+        if flush_task is not None:
+            await flush_task
+
+        await self.flush()
+        await self.delegate.close()
@@ -4,10 +4,11 @@ Console output adapter for Artissist Logger Python client
 """
 
 import sys
-from typing import Any, Dict
+from dataclasses import asdict
+from typing import Any, Dict, List, Tuple
 
 from ..types import LogLevel, LogEntry
-from .base import LogAdapter
+from .base import LogAdapter, _dumps_line
 
 
 class ConsoleAdapter(LogAdapter):
@@ -25,35 +26,57 @@ class ConsoleAdapter(LogAdapter):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.use_colors = config.get("colors", True)
+        self.format = config.get("format", "text")  # "text" or "json"
+        self.needs_formatting = self.format != "json"
         self.output_stream = (
             sys.stderr if config.get("use_stderr", False) else sys.stdout
         )
+        # isatty() is a syscall, so resolve color support once up front
+        self._colorize = self.use_colors and sys.stdout.isatty()
 
     async def write(self, message: LogEntry, formatted_message: str):
         """Write message to console with optional color formatting"""
-        output_message = formatted_message
+        # One write and flush per record instead of one print per line
+        self.output_stream.write(self._render(message, formatted_message))
+        self.output_stream.flush()
 
-        if self.use_colors and sys.stdout.isatty():
-            color = self.COLORS.get(message.level or LogLevel.INFO, "")
-            output_message = f"{color}{formatted_message}{self.RESET}"
+    async def write_batch(self, entries: List[Tuple[LogEntry, str]]):
+        """Write several messages with a single write and flush"""
+        self.output_stream.write(
+            "".join(
+                self._render(message, formatted_message)
+                for message, formatted_message in entries
+            )
+        )
+        self.output_stream.flush()
 
-        print(output_message, file=self.output_stream)
+    def _render(self, message: LogEntry, formatted_message: str) -> str:
+        """Render one log entry as the text written to the stream"""
+        if self.format == "json":
+            # One structured line; error and metrics are nested fields
+            return _dumps_line(message).decode("utf-8")
+
+        colorize = self._colorize
+
+        if colorize:
+            color = self.COLORS.get(message.level or LogLevel.INFO, "")
+            output = f"{color}{formatted_message}{self.RESET}\n"
+        else:
+            output = formatted_message + "\n"
 
         # Add error details if present
         if message.error:
             error_output = (
                 f"  ERROR: {message.error.type}: {message.error.message}"
             )
-            if self.use_colors and sys.stdout.isatty():
+            if colorize:
                 error_output = (
                     f"{self.COLORS[LogLevel.ERROR]}{error_output}{self.RESET}"
                 )
-            print(error_output, file=self.output_stream)
+            output += error_output + "\n"
 
         # Add metrics if present
         if message.metrics:
-            from dataclasses import asdict
-
             metrics_dict = asdict(message.metrics)
             # Filter out None values
             metrics_dict = {
@@ -63,14 +86,13 @@ class ConsoleAdapter(LogAdapter):
                 metrics_output = "  METRICS: " + ", ".join(
                     f"{k}={v}" for k, v in metrics_dict.items()
                 )
-                if self.use_colors and sys.stdout.isatty():
+                if colorize:
                     metrics_output = (
                         f"\033[35m{metrics_output}{self.RESET}"  # \
                     )
-                print(metrics_output, file=self.output_stream)
+                output += metrics_output + "\n"
 
-        # Flush output
-        self.output_stream.flush()
+        return output
 
     async def close(self):
         """Console adapter doesn't need cleanup"""
@@ -4,13 +4,15 @@ File output adapter for Artissist Logger Python client
 """
 
 import asyncio
-import json
-from dataclasses import asdict
+import atexit
+import os
+import time
+import weakref
 from pathlib import Path
-from typing import Any, Dict, Optional, TextIO
+from typing import Any, Dict, List, Optional, TextIO, Tuple
 
 from ..types import LogEntry
-from .base import LogAdapter
+from .base import LogAdapter, _dumps_line
 
 try:
     import aiofiles
@@ -20,6 +22,21 @@ except ImportError:
     HAS_AIOFILES = False
     aiofiles = None  # type: ignore
 
+# Buffered adapters still alive; flushed at interpreter exit so records
+# are not lost when close() is never awaited
+_BUFFERED_ADAPTERS: "weakref.WeakSet[FileAdapter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_buffered_adapters():
+    """Write out every buffered adapter's pending records"""
+    for adapter in list(_BUFFERED_ADAPTERS):
+        try:
+            adapter.flush()
+        except OSError:
+            # Ignore I/O errors to prevent logging failures
+            pass
+
 
 class FileAdapter(LogAdapter):
     """Outputs log messages to files with rotation support"""
@@ -28,10 +45,15 @@ class FileAdapter(LogAdapter):
         super().__init__(config)
         self.file_path = Path(config["file_path"])
         self.format = config.get("format", "text")  # "text" or "json"
+        self.needs_formatting = self.format != "json"
         self.rotate = config.get("rotate", False)
         self.max_size_mb = config.get("max_size_mb", 10)
         self.max_files = config.get("max_files", 5)
         self.use_async = config.get("async", True) and HAS_AIOFILES
+        # Buffered mode: accumulate encoded records and os.write() them once
+        # buffer_bytes is reached or flush_interval_ms has elapsed
+        self.buffer_bytes = config.get("buffer_bytes", 0)
+        self.flush_interval = config.get("flush_interval_ms", 10) / 1000
 
         # Ensure directory exists
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -39,70 +61,156 @@ class FileAdapter(LogAdapter):
         self._file_handle: Optional[TextIO] = None
         self._lock = asyncio.Lock() if self.use_async else None
 
+        self._fd: Optional[int] = None
+        # Size of the file behind _fd, tracked so rotation needs no stat()
+        self._fd_size = 0
+        self._buffer = bytearray()
+        self._last_flush = time.monotonic()
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        if self.buffer_bytes:
+            _BUFFERED_ADAPTERS.add(self)
+
     async def write(self, message: LogEntry, formatted_message: str):
         """Write message to file"""
+        if self.buffer_bytes:
+            self._render_into(self._buffer, message, formatted_message)
+            self._buffer_written()
+        else:
+            data = bytearray()
+            self._render_into(data, message, formatted_message)
+            await self._append(data)
+
+    async def write_batch(self, entries: List[Tuple[LogEntry, str]]):
+        """Write several messages with a single file open and write"""
+        data = self._buffer if self.buffer_bytes else bytearray()
+        for message, formatted_message in entries:
+            self._render_into(data, message, formatted_message)
+        if self.buffer_bytes:
+            self._buffer_written()
+        else:
+            await self._append(data)
+
+    def _render_into(
+        self, data: bytearray, message: LogEntry, formatted_message: str
+    ):
+        """Append one log entry's UTF-8 bytes to data
+
+        Pieces go straight into the target buffer (in buffered mode, the
+        adapter's own), so no per-record intermediate strings are built.
+        """
+        if self.format == "json":
+            data += _dumps_line(message)
+            return
+
+        data += formatted_message.encode("utf-8")
+        data += b"\n"
+
+        # Add structured data for errors and metrics
+        if message.error:
+            data += b"  ERROR: "
+            data += _dumps_line(message.error)
+
+        if message.metrics:
+            data += b"  METRICS: "
+            data += _dumps_line(message.metrics)
+
+    def _buffer_written(self):
+        """Flush the write buffer if it is full or stale, else arm the timer"""
+        if (
+            len(self._buffer) >= self.buffer_bytes
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+        elif self._flush_timer is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self._flush_timer = loop.call_later(
+                self.flush_interval, self._on_flush_timer
+            )
+
+    def _on_flush_timer(self):
+        """Bound the latency of a partially filled buffer"""
+        self._flush_timer = None
+        try:
+            self.flush()
+        except OSError:
+            # Ignore I/O errors to prevent logging failures
+            pass
+
+    def flush(self):
+        """Write any buffered records to the file"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+
+        if self._fd is None:
+            self._open_fd()
+
+        if self.rotate and self._fd_size >= self.max_size_mb * 1024 * 1024:
+            self._close_fd()
+            self._rotate_file_sync()
+            self._open_fd()
+
+        data = memoryview(self._buffer)
+        try:
+            while data:
+                written = os.write(self._fd, data)
+                self._fd_size += written
+                data = data[written:]
+        finally:
+            data.release()
+            self._buffer.clear()
+
+    def _open_fd(self):
+        """Open the buffered-mode file descriptor for appending"""
+        self._fd = os.open(
+            self.file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        self._fd_size = os.fstat(self._fd).st_size
+
+    def _close_fd(self):
+        """Close the buffered-mode file descriptor, if open"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    async def _append(self, data: bytearray):
+        """Append rendered UTF-8 bytes using the configured I/O mode"""
         if self.use_async and self._lock:
             async with self._lock:
-                await self._write_async(message, formatted_message)
+                await self._write_async(data)
         else:
-            await self._write_sync(message, formatted_message)
+            await self._write_sync(data)
 
-    async def _write_async(self, message: LogEntry, formatted_message: str):
+    async def _write_async(self, data: bytearray):
         """Async file writing using aiofiles"""
         if not HAS_AIOFILES:
-            await self._write_sync(message, formatted_message)
+            await self._write_sync(data)
             return
 
         # Check for rotation
         if self.rotate and self._should_rotate():
             await self._rotate_file_async()
 
-        async with aiofiles.open(self.file_path, "a", encoding="utf-8") as f:
-            if self.format == "json":
-                log_data = asdict(message)
-                await f.write(json.dumps(log_data) + "\n")
-            else:
-                await f.write(formatted_message + "\n")
-
-                # Add structured data for errors and metrics
-                if message.error:
-                    error_line = (
-                        f"  ERROR: {json.dumps(asdict(message.error))}"
-                    )
-                    await f.write(error_line + "\n")
-
-                if message.metrics:
-                    metrics_line = (
-                        f"  METRICS: {json.dumps(asdict(message.metrics))}"
-                    )
-                    await f.write(metrics_line + "\n")
-
-    async def _write_sync(self, message: LogEntry, formatted_message: str):
+        # Binary mode: the records are already UTF-8, so nothing is
+        # decoded here only to be encoded again by a text wrapper
+        async with aiofiles.open(self.file_path, "ab") as f:
+            await f.write(data)
+
+    async def _write_sync(self, data: bytearray):
         """Synchronous file writing"""
         # Check for rotation
         if self.rotate and self._should_rotate():
             self._rotate_file_sync()
 
-        with open(self.file_path, "a", encoding="utf-8") as f:
-            if self.format == "json":
-                log_data = asdict(message)
-                f.write(json.dumps(log_data) + "\n")
-            else:
-                f.write(formatted_message + "\n")
-
-                # Add structured data for errors and metrics
-                if message.error:
-                    error_line = (
-                        f"  ERROR: {json.dumps(asdict(message.error))}"
-                    )
-                    f.write(error_line + "\n")
-
-                if message.metrics:
-                    metrics_line = (
-                        f"  METRICS: {json.dumps(asdict(message.metrics))}"
-                    )
-                    f.write(metrics_line + "\n")
-
+        with open(self.file_path, "ab") as f:
+            f.write(data)
             f.flush()
 
     def _should_rotate(self) -> bool:
@@ -164,7 +272,10 @@ class FileAdapter(LogAdapter):
         self.file_path.rename(rotated_file)
 
     async def close(self):
-        """Close file handles"""
+        """Flush buffered records and close file handles"""
+        self.flush()
+        self._close_fd()
+        _BUFFERED_ADAPTERS.discard(self)
         if self._file_handle:
             self._file_handle.close()
             self._file_handle = None
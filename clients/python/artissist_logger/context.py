@@ -3,13 +3,27 @@
 Context management for distributed tracing in Artissist Logger Python client
 """
 
-import uuid
-from contextvars import ContextVar
+import secrets
+from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
+from .generated_types import DATACLASS_OPTIONS
+
+# Built-in tracing fields; any other context key is custom context
+_CONTEXT_FIELDS = frozenset(
+    (
+        "correlation_id",
+        "user_id",
+        "session_id",
+        "request_id",
+        "trace_id",
+        "span_id",
+    )
+)
+
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class LoggerContext:
     """Context information for distributed logging"""
 
@@ -72,7 +86,7 @@ class LoggerContext:
     ) -> "LoggerContext":
         """Create context with generated or provided correlation ID"""
         return cls(
-            correlation_id=correlation_id or f"corr_{uuid.uuid4().hex[:16]}"
+            correlation_id=correlation_id or f"corr_{secrets.token_hex(8)}"
         )
 
     @classmethod
@@ -98,14 +112,17 @@ class ContextManager:
     """Manages logger context in async environments"""
 
     @staticmethod
-    def set_context(context: LoggerContext):
-        """Set current context"""
-        _current_context.set(context)
+    def set_context(context: LoggerContext) -> Token:
+        """Set current context, returning a token for reset_context"""
+        return _current_context.set(context)
+
+    # Bound straight to the C-level ContextVar.get; called on every log
+    get_context = staticmethod(_current_context.get)
 
     @staticmethod
-    def get_context() -> Optional[LoggerContext]:
-        """Get current context"""
-        return _current_context.get()
+    def reset_context(token: Token):
+        """Restore the context that was current before set_context"""
+        _current_context.reset(token)
 
     @staticmethod
     def clear_context():
@@ -137,11 +154,10 @@ class _ContextScope:
 
     def __init__(self, **kwargs):
         self.kwargs = kwargs
-        self.previous_context = None
+        self._token: Optional[Token] = None
 
     def __enter__(self):
-        self.previous_context = _current_context.get()
-        current = self.previous_context or LoggerContext()
+        current = _current_context.get() or LoggerContext()
 
         # Create new context with updates
         new_context = LoggerContext(
@@ -157,21 +173,15 @@ class _ContextScope:
                 **{
                     k: v
                     for k, v in self.kwargs.items()
-                    if k
-                    not in [
-                        "correlation_id",
-                        "user_id",
-                        "session_id",
-                        "request_id",
-                        "trace_id",
-                        "span_id",
-                    ]
+                    if k not in _CONTEXT_FIELDS
                 },
             },
         )
 
-        _current_context.set(new_context)
+        self._token = _current_context.set(new_context)
         return new_context
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        _current_context.set(self.previous_context)
+        if self._token is not None:
+            _current_context.reset(self._token)
+            self._token = None
@@ -19,6 +19,21 @@ class EmojiMapping:
     is_default: bool = True
 
 
+# Default mappings are fixed at import time, so build them once per process
+_DEFAULT_MAPPINGS: Dict[LogEvent, EmojiMapping] = {
+    event: EmojiMapping(
+        str(config["emoji"]),
+        str(config["description"]),
+        bool(config["is_default"]),
+    )
+    for event, config in TYPED_EMOJI_MAPPINGS.items()
+}
+# Emoji alone, so get_emoji() skips the EmojiMapping attribute access
+_DEFAULT_EMOJI: Dict[LogEvent, str] = {
+    event: mapping.emoji for event, mapping in _DEFAULT_MAPPINGS.items()
+}
+
+
 class EmojiResolver:
     """Resolves log events to emoji representations"""
 
@@ -89,26 +104,14 @@ class EmojiResolver:
         LogEvent.AUDIT_TRAIL: EmojiMapping("📋", "Audit trail events"),
     }
 
+    # Default mappings from generated Smithy types, shared by all resolvers
+    default_mappings: Dict[LogEvent, EmojiMapping] = _DEFAULT_MAPPINGS
+
     def __init__(
         self, custom_mappings: Optional[Dict[str, EmojiMapping]] = None
     ):
         """Initialize with optional custom emoji mappings"""
         self.custom_mappings = custom_mappings or {}
-        self._default_mappings: Optional[Dict[LogEvent, EmojiMapping]] = None
-
-    @property
-    def default_mappings(self) -> Dict[LogEvent, EmojiMapping]:
-        """Get default emoji mappings from generated Smithy types"""
-        if self._default_mappings is None:
-            self._default_mappings = {
-                event: EmojiMapping(
-                    str(config["emoji"]),
-                    str(config["description"]),
-                    bool(config["is_default"]),
-                )
-                for event, config in TYPED_EMOJI_MAPPINGS.items()
-            }
-        return self._default_mappings
 
     def get_emoji(
         self, event: Optional[LogEvent], custom_event: Optional[str] = None
@@ -123,8 +126,10 @@ class EmojiResolver:
         Returns:
             Emoji string or None if not found
         """
-        if event and event in self.default_mappings:
-            return self.default_mappings[event].emoji
+        if event:
+            emoji = _DEFAULT_EMOJI.get(event)
+            if emoji:
+                return emoji
 
         if custom_event and custom_event in self.custom_mappings:
             return self.custom_mappings[custom_event].emoji
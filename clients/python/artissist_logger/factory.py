@@ -9,11 +9,13 @@ from .adapters.base import LogAdapter
 from .adapters.console import ConsoleAdapter
 from .adapters.file import FileAdapter
 from .context import LoggerContext
+from .emoji import EmojiResolver
 from .logger import Logger
 from .generated_types import (
     AgentLoggerConfig,
     LoggerConfig,
     LoggingContext,
+    LogLevel,
     AdapterName,
 )
 
@@ -29,6 +31,8 @@ class LoggerFactory:
         emojis: bool = False,
         context: Optional[LoggerContext] = None,
         adapter_configs: Optional[Dict[str, Dict[str, Any]]] = None,
+        level: Optional[LogLevel] = None,
+        emoji_resolver: Optional[EmojiResolver] = None,
     ) -> Logger:
         """
         Create a logger with specified configuration
@@ -40,6 +44,8 @@ class LoggerFactory:
             emojis: Enable emoji support
             context: Base context
             adapter_configs: Configuration for each adapter
+            level: Minimum log level to emit (all levels if omitted)
+            emoji_resolver: Custom emoji resolver shared by derived loggers
         """
         adapter_configs = adapter_configs or {}
         adapter_instances: List[LogAdapter] = []
@@ -80,10 +86,11 @@ class LoggerFactory:
             adapters=adapter_names,
             emojis=emojis,
             context=logging_context,
+            level=level,
         )
 
         # Pass adapter instances separately to Logger
-        return Logger(config, adapter_instances)
+        return Logger(config, adapter_instances, emoji_resolver)
 
     @staticmethod
     def create_frontend_logger(
@@ -92,6 +99,7 @@ class LoggerFactory:
         emojis: bool = False,
         context: Optional[LoggerContext] = None,
         adapters: Optional[List[str]] = None,
+        level: Optional[LogLevel] = None,
     ) -> Logger:
         """
         Create logger optimized for frontend applications
@@ -102,6 +110,7 @@ class LoggerFactory:
             emojis: Enable emojis (recommended for development)
             context: Base context
             adapters: Override default adapters
+            level: Minimum log level to emit (all levels if omitted)
         """
         # Frontend typically uses console only
         adapters = adapters or ["console"]
@@ -117,6 +126,7 @@ class LoggerFactory:
             emojis=emojis,
             context=context,
             adapter_configs=adapter_configs,
+            level=level,
         )
 
     @staticmethod
@@ -126,6 +136,7 @@ class LoggerFactory:
         emojis: bool = False,
         context: Optional[LoggerContext] = None,
         adapters: Optional[List[str]] = None,
+        level: Optional[LogLevel] = None,
     ) -> Logger:
         """
         Create logger optimized for backend services
@@ -136,6 +147,7 @@ class LoggerFactory:
             emojis: Enable emojis (typically false for production)
             context: Base context with deployment info
             adapters: Override default adapters
+            level: Minimum log level to emit (all levels if omitted)
         """
         # Backend uses both console and file
         adapters = adapters or ["console", "file"]
@@ -161,6 +173,7 @@ class LoggerFactory:
             emojis=emojis,
             context=context,
             adapter_configs=adapter_configs,
+            level=level,
         )
 
     @staticmethod
@@ -221,6 +234,7 @@ class LoggerFactory:
             emojis=config.emojis or False,
             context=agent_context,
             adapter_configs=adapter_configs,
+            level=config.level,
         )
 
     @staticmethod
@@ -230,6 +244,7 @@ class LoggerFactory:
         emojis: bool = False,
         context: Optional[LoggerContext] = None,
         adapters: Optional[List[str]] = None,
+        level: Optional[LogLevel] = None,
     ) -> Logger:
         """
         Create logger optimized for infrastructure components
@@ -240,6 +255,7 @@ class LoggerFactory:
             emojis: Enable emojis (typically false)
             context: Base context with infrastructure info
             adapters: Override default adapters
+            level: Minimum log level to emit (all levels if omitted)
         """
         service = f"infra-{component}"
 
@@ -267,4 +283,5 @@ class LoggerFactory:
             emojis=emojis,
             context=context,
             adapter_configs=adapter_configs,
+            level=level,
         )
@@ -6,6 +6,7 @@ This file is automatically generated. Do not edit directly.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
@@ -13,6 +14,11 @@ from typing import Any, Dict, List, Optional, Union
 # Document type for arbitrary JSON data
 Document = Any
 
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
 
 class AdapterName(Enum):
     """Supported adapter types"""
@@ -143,7 +149,7 @@ CustomEventMap = Dict[str, "EmojiMapping"]
 EmojiMappingMap = Dict[str, "EmojiMapping"]
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class AWSContext:
     """AWS-specific context for infrastructure logging"""
 
@@ -165,7 +171,7 @@ class AWSContext:
     ecs_info: Optional["ECSInfo"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class AgentLogEntry:
     """Extension for agent-specific logging"""
 
@@ -181,7 +187,7 @@ class AgentLogEntry:
     tool_context: Optional["ToolExecutionContext"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class AgentLoggerConfig:
     """Configuration for agent-specific loggers"""
 
@@ -201,7 +207,7 @@ class AgentLoggerConfig:
     level: Optional["LogLevel"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class BrowserAdapterConfig:
     """Browser adapter configuration"""
 
@@ -217,7 +223,7 @@ class BrowserAdapterConfig:
     use_console_error: Optional[bool] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ClientInfo:
     """Browser and client environment information"""
 
@@ -239,7 +245,7 @@ class ClientInfo:
     timezone: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ConsoleAdapterConfig:
     """Console adapter configuration"""
 
@@ -255,7 +261,7 @@ class ConsoleAdapterConfig:
     use_stderr: Optional[bool] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class CoordinateInfo:
     """Coordinate information for user interactions"""
 
@@ -269,7 +275,7 @@ class CoordinateInfo:
     relative_y: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class CostImpact:
     """Cost impact information for infrastructure changes"""
 
@@ -283,14 +289,14 @@ class CostImpact:
     resource_cost_breakdown: Optional["Document"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class CreateBatchLogEntriesRequest:
     """Request structure for batch log entry creation"""
 
     log_entries: Optional["LogEntryList"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class CreateBatchLogEntriesResponse:
     """Response structure for batch log entry creation"""
 
@@ -299,7 +305,7 @@ class CreateBatchLogEntriesResponse:
     failed_entries: Optional["FailedLogEntryList"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class CreateLogEntryRequest:
     """Request/Response Structures
     Request structure for creating a single log entry"""
@@ -307,7 +313,7 @@ class CreateLogEntryRequest:
     log_entry: Optional["LogEntry"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class CreateLogEntryResponse:
     """Response structure for log entry creation"""
 
@@ -316,7 +322,7 @@ class CreateLogEntryResponse:
     status: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class DefaultEmojiMappings:
     """Default emoji mappings for all log events"""
 
@@ -324,7 +330,7 @@ class DefaultEmojiMappings:
     mappings: Optional["EmojiMappingMap"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class DeploymentContext:
     """Deployment context for infrastructure operations"""
 
@@ -346,7 +352,7 @@ class DeploymentContext:
     branch: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ECSInfo:
     """ECS-specific information"""
 
@@ -362,7 +368,7 @@ class ECSInfo:
     task_definition_revision: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class EmojiMapping:
     """Emoji mapping configuration for events"""
 
@@ -374,7 +380,7 @@ class EmojiMapping:
     is_default: Optional[bool] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ErrorContext:
     """Error context with file and location information"""
 
@@ -388,7 +394,7 @@ class ErrorContext:
     data: Optional["Document"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ErrorDetails:
     """Error details for error-level log entries"""
 
@@ -404,7 +410,7 @@ class ErrorDetails:
     context: Optional["ErrorContext"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class FailedLogEntry:
     """Failed log entry for batch operations"""
 
@@ -412,7 +418,7 @@ class FailedLogEntry:
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class FileAdapterConfig:
     """File adapter configuration"""
 
@@ -434,7 +440,7 @@ class FileAdapterConfig:
     max_files: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class FrontendLogEntry:
     """Extension for frontend-specific logging"""
 
@@ -448,21 +454,21 @@ class FrontendLogEntry:
     performance_timing: Optional["PerformanceTiming"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class GetLogEntryRequest:
     """Request structure for getting a single log entry"""
 
     log_id: Optional["LogId"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class GetLogEntryResponse:
     """Response structure for getting a single log entry"""
 
     log_entry: Optional["LogEntry"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class InfrastructureLogEntry:
     """Extension for infrastructure logging"""
 
@@ -476,7 +482,7 @@ class InfrastructureLogEntry:
     resource_metrics: Optional["ResourceMetrics"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class InfrastructureLoggerConfig:
     """Configuration for infrastructure loggers"""
 
@@ -496,7 +502,7 @@ class InfrastructureLoggerConfig:
     level: Optional["LogLevel"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class LocalStorageAdapterConfig:
     """LocalStorage adapter configuration"""
 
@@ -512,7 +518,7 @@ class LocalStorageAdapterConfig:
     max_entries: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class LogEntry:
     """Primary log entry structure"""
 
@@ -542,7 +548,7 @@ class LogEntry:
     error: Optional["ErrorDetails"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class LogMetadata:
     """Flexible metadata container for additional log data"""
 
@@ -560,7 +566,7 @@ class LogMetadata:
     custom_event_mappings: Optional["CustomEventMap"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class LoggerConfig:
     """Logger configuration structure"""
 
@@ -578,7 +584,7 @@ class LoggerConfig:
     level: Optional["LogLevel"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class LoggerFactoryConfig:
     """Factory configuration for creating loggers"""
 
@@ -594,7 +600,7 @@ class LoggerFactoryConfig:
     default_level: Optional["LogLevel"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class LoggingContext:
     """Context information for distributed tracing and correlation"""
 
@@ -614,7 +620,7 @@ class LoggingContext:
     parent_correlation_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class MemoryInfo:
     """Memory usage information from the browser"""
 
@@ -626,7 +632,7 @@ class MemoryInfo:
     js_heap_size_limit: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ObservationContext:
     """Context for observation processing in agents"""
 
@@ -644,7 +650,7 @@ class ObservationContext:
     entities_count: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class PerformanceMetrics:
     """Performance metrics for operations"""
 
@@ -658,7 +664,7 @@ class PerformanceMetrics:
     counters: Optional["MetricsMap"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class PerformanceTiming:
     """Browser performance timing information"""
 
@@ -678,7 +684,7 @@ class PerformanceTiming:
     memory_info: Optional["MemoryInfo"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class QueryLogsRequest:
     """Request structure for querying logs"""
 
@@ -704,7 +710,7 @@ class QueryLogsRequest:
     next_token: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class QueryLogsResponse:
     """Response structure for log queries"""
 
@@ -713,7 +719,7 @@ class QueryLogsResponse:
     total_count: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ResourceMetrics:
     """Resource metrics for infrastructure operations"""
 
@@ -731,7 +737,7 @@ class ResourceMetrics:
     cost_impact: Optional["CostImpact"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ServiceError:
     """Server error for service failures"""
 
@@ -740,7 +746,7 @@ class ServiceError:
     code: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class StandardEmojiMappings:
     """Standard emoji mappings for log events"""
 
@@ -748,7 +754,7 @@ class StandardEmojiMappings:
     mappings: Optional["EmojiMappingMap"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ToolExecutionContext:
     """Context for tool execution within agents"""
 
@@ -766,7 +772,7 @@ class ToolExecutionContext:
     success: Optional[bool] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class UserInteractionContext:
     """User interaction context for frontend events"""
 
@@ -786,7 +792,7 @@ class UserInteractionContext:
     interaction_data: Optional["Document"] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ValidationError:
     """Error definitions
     Client error for validation failures"""
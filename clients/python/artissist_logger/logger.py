@@ -4,18 +4,139 @@ Core Logger implementation for Artissist Logger Python client
 """
 
 import asyncio
+import concurrent.futures
+import threading
 from datetime import datetime
-
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Set,
+)
+
+from .adapters.base import LogAdapter
+from .adapters.console import ConsoleAdapter
+from .adapters.file import FileAdapter
 from .context import ContextManager, LoggerContext
 from .emoji import EmojiResolver
-from .types import LogEntryParams, LogLevel, LogEntry
+from .types import (
+    ErrorDetails,
+    LogEntry,
+    LogEntryParams,
+    LogEvent,
+    LogLevel,
+    LogMetadata,
+    PerformanceMetrics,
+)
 from .generated_types import LoggingContext, LoggerConfig
 
+# Bound once to skip the attribute lookup on every log call
+_utcnow = datetime.utcnow
+
+# Numeric severity used for level gating, mirroring stdlib logging ranks
+_LEVEL_RANK = {
+    LogLevel.TRACE: 5,
+    LogLevel.DEBUG: 10,
+    LogLevel.INFO: 20,
+    LogLevel.WARN: 30,
+    LogLevel.ERROR: 40,
+    LogLevel.FATAL: 50,
+}
+
+
+def _coerce_level(level) -> Optional[LogLevel]:
+    """Accept a LogLevel or its name (e.g. "INFO") as a minimum level"""
+    if level is None or isinstance(level, LogLevel):
+        return level
+    try:
+        return LogLevel(str(level).upper())
+    except ValueError:
+        raise ValueError(f"Unknown log level: {level!r}") from None
+
+
+# Default adapter constructors keyed by lower-case adapter name
+_ADAPTER_REGISTRY: Dict[str, Callable[[str], LogAdapter]] = {
+    "console": lambda _service: ConsoleAdapter({}),
+    "file": lambda service: FileAdapter({"file_path": f"logs/{service}.log"}),
+}
+
+
+# Fallback loop for sync records logged before any async call; shared by
+# every logger and started in one daemon thread on first use
+_PRIVATE_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_PRIVATE_LOCK = threading.Lock()
+
+
+def _private_loop() -> asyncio.AbstractEventLoop:
+    """Start the fallback loop thread once per process"""
+    global _PRIVATE_LOOP  # pylint: disable=global-statement
+    with _PRIVATE_LOCK:
+        if _PRIVATE_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="artissist-logger-sync",
+                daemon=True,
+            ).start()
+            _PRIVATE_LOOP = loop
+        return _PRIVATE_LOOP
+
+
+class _SyncDispatcher:
+    """Hands records from the *_sync methods to the loop owning the adapters
+
+    Adapters are not thread-safe and may hold loop-bound state (timers,
+    asyncio locks), so sync records are scheduled onto the event loop that
+    last ran an async log call on the same logger (or one of its
+    with_context children). Loggers that have not logged asynchronously
+    yet use a private loop, run forever in one daemon thread.
+    """
+
+    def __init__(self) -> None:
+        # Loop of this logger's most recent async log call
+        self.owner: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        # Scheduled but unfinished records, awaited by flush() and close()
+        self._pending: Set["concurrent.futures.Future[None]"] = set()
+
+    def submit(self, coro: Coroutine[Any, Any, None]):
+        """Schedule a log coroutine on the owning (or private) loop"""
+        loop = self.owner
+        if loop is None or not loop.is_running():
+            loop = _private_loop()
+        # Scheduled from the caller's thread, so the task runs in a copy
+        # of the caller's context and ContextManager values apply
+        try:
+            future = asyncio.run_coroutine_threadsafe(coro, loop)
+        except RuntimeError:
+            # The owning loop closed after the is_running check
+            future = asyncio.run_coroutine_threadsafe(coro, _private_loop())
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+
+    def _done(self, future: "concurrent.futures.Future[None]"):
+        with self._lock:
+            self._pending.discard(future)
+
+    def snapshot(self) -> List["concurrent.futures.Future[None]"]:
+        """Records scheduled so far and not yet written"""
+        with self._lock:
+            return list(self._pending)
+
 
 class Logger:
     """Core logger implementation with emoji support and context management"""
 
-    def __init__(self, config: LoggerConfig, adapter_instances=None):
+    def __init__(
+        self,
+        config: LoggerConfig,
+        adapter_instances=None,
+        emoji_resolver: Optional[EmojiResolver] = None,
+    ):
         """
         Initialize logger
 
@@ -23,10 +144,15 @@ class Logger:
             config: Logger configuration containing service, environment,
                 adapter names
             adapter_instances: Pre-created adapter instances (for factory use)
+            emoji_resolver: Shared emoji resolver (a new one if omitted)
         """
         self.service = config.service or "unknown"
         self.environment = config.environment or "dev"
         self.emojis = config.emojis or False
+        self.level = _coerce_level(config.level)
+
+        # Resolve the minimum level once so disabled calls return early
+        self._level_rank = _LEVEL_RANK[self.level] if self.level else 0
 
         # Convert LoggingContext to LoggerContext for internal use
         if config.context:
@@ -47,91 +173,149 @@ class Logger:
         else:
             self.adapters = self._resolve_adapters(config.adapters or [])
 
-        self.emoji_resolver = EmojiResolver()
+        self.emoji_resolver = emoji_resolver or EmojiResolver()
+
+        # Shared with with_context() children, which use the same adapters
+        self._sync = _SyncDispatcher()
 
     def _resolve_adapters(self, adapter_names):
         """Resolve adapter names to adapter instances"""
-        from .adapters.console import ConsoleAdapter
-        from .adapters.file import FileAdapter
-
         adapter_instances = []
         for adapter_name in adapter_names:
-            if adapter_name == "console" or adapter_name.value == "console":
-                adapter_instances.append(ConsoleAdapter({}))
-            elif adapter_name == "file" or adapter_name.value == "file":
-                adapter_instances.append(
-                    FileAdapter({"file_path": f"logs/{self.service}.log"})
-                )
-            # Add other adapters as needed
+            key = (
+                adapter_name
+                if isinstance(adapter_name, str)
+                else adapter_name.value
+            )
+            create = _ADAPTER_REGISTRY.get(key.lower())
+            if create:
+                adapter_instances.append(create(self.service))
         return adapter_instances
 
-    def _convert_to_adapter_names(self):
-        """Convert current adapter instances back to AdapterName enums"""
-        from .generated_types import AdapterName
-
-        adapter_names = []
-        for adapter in self.adapters:
-            adapter_class_name = adapter.__class__.__name__.lower()
-            if "console" in adapter_class_name:
-                adapter_names.append(AdapterName.CONSOLE)
-            elif "file" in adapter_class_name:
-                adapter_names.append(AdapterName.FILE)
-            # Add other adapter mappings as needed
-        return adapter_names
-
-    async def log(self, params: LogEntryParams):
+    def _clone(self, base_context: LoggerContext) -> "Logger":
+        """Create a child logger sharing adapters and emoji resolver"""
+        child = Logger.__new__(Logger)
+        # Copy every attribute (including private ones) in one step
+        child.__dict__.update(self.__dict__)
+        child.base_context = base_context
+        return child
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check whether a message at the given level would be emitted"""
+        return _LEVEL_RANK[level] >= self._level_rank
+
+    def _resolve_context(
+        self, provided: Optional[LoggingContext]
+    ) -> LoggingContext:
+        """Build the effective context for one log call"""
+        # Resolve each field with precedence provided -> current -> base,
+        # without materialising intermediate merged contexts
+        current = ContextManager.get_context()
+        base = self.base_context
+        return LoggingContext(
+            correlation_id=(provided and provided.correlation_id)
+            or (current and current.correlation_id)
+            or base.correlation_id,
+            trace_id=(provided and provided.trace_id)
+            or (current and current.trace_id)
+            or base.trace_id,
+            span_id=(provided and provided.span_id)
+            or (current and current.span_id)
+            or base.span_id,
+            user_id=(provided and provided.user_id)
+            or (current and current.user_id)
+            or base.user_id,
+            session_id=(provided and provided.session_id)
+            or (current and current.session_id)
+            or base.session_id,
+            request_id=(provided and provided.request_id)
+            or (current and current.request_id)
+            or base.request_id,
+        )
+
+    async def log(
+        self,
+        level: LogLevel,
+        message: str,
+        *,
+        event: Optional[LogEvent] = None,
+        custom_event: Optional[str] = None,
+        metadata: Optional[LogMetadata] = None,
+        metrics: Optional[PerformanceMetrics] = None,
+        error: Optional[ErrorDetails] = None,
+        tags: Optional[List[str]] = None,
+        context: Optional[LoggingContext] = None,
+    ):
         """
         Core logging method
 
         Args:
-            params: LogEntryParams containing all log entry parameters
+            level: Severity level of the entry
+            message: Human-readable log message
+            event: Pre-defined event type
+            custom_event: Custom event name for emoji lookup
+            metadata: Additional structured data
+            metrics: Performance metrics
+            error: Error details
+            tags: Optional labels
+            context: Per-call context overriding current and base context
         """
-        # Merge contexts: base -> current -> provided
-        current_context = ContextManager.get_context()
-        final_context = self.base_context
-        if current_context:
-            final_context = final_context.merge(current_context)
-        if params.context:
-            final_context = final_context.merge(params.context)
-
-        # Convert LoggerContext to LoggingContext for LogEntry
-        logging_context = LoggingContext(
-            correlation_id=final_context.correlation_id,
-            trace_id=final_context.trace_id,
-            span_id=final_context.span_id,
-            user_id=final_context.user_id,
-            session_id=final_context.session_id,
-            request_id=final_context.request_id,
-        )
+        # pylint: disable=unused-argument
+        if _LEVEL_RANK[level] < self._level_rank:
+            return
+
+        # Remember which loop drives the adapters for the *_sync methods
+        self._sync.owner = asyncio.get_running_loop()
+
+        logging_context = self._resolve_context(context)
 
         # Create log message
         log_message = LogEntry(
-            timestamp=datetime.utcnow().isoformat(),
-            level=params.level,
-            message=params.message,
+            timestamp=_utcnow().isoformat(),
+            level=level,
+            message=message,
             service=self.service,
-            event=params.event,
+            event=event,
             context=logging_context,
-            metadata=params.metadata,
-            metrics=params.metrics,
-            error=params.error,
+            metadata=metadata,
+            metrics=metrics,
+            error=error,
         )
 
         # Get emoji if enabled
         emoji = None
         if self.emojis:
-            emoji = self.emoji_resolver.get_emoji(
-                params.event, params.custom_event
-            )
+            emoji = self.emoji_resolver.get_emoji(event, custom_event)
+
+        # Single adapter (the common console-only case) needs no gather
+        if len(self.adapters) == 1:
+            adapter = self.adapters[0]
+            try:
+                await adapter.write(
+                    log_message,
+                    (
+                        adapter.format_message(log_message, self.emojis, emoji)
+                        if adapter.needs_formatting
+                        else ""
+                    ),
+                )
+            except Exception:
+                # Ignore adapter errors to prevent logging failures
+                pass
+            return
 
         # Format and send to all adapters
-        tasks = []
-        for adapter in self.adapters:
-            formatted_message = adapter.format_message(
-                log_message, self.emojis, emoji
+        tasks = [
+            adapter.write(
+                log_message,
+                (
+                    adapter.format_message(log_message, self.emojis, emoji)
+                    if adapter.needs_formatting
+                    else ""
+                ),
             )
-            task = adapter.write(log_message, formatted_message)
-            tasks.append(task)
+            for adapter in self.adapters
+        ]
 
         if tasks:
             try:
@@ -140,49 +324,102 @@ class Logger:
                 # Ignore adapter errors to prevent logging failures
                 pass
 
-    async def debug(self, message: str, **kwargs):
-        """Log debug message"""
+    async def log_params(self, params: LogEntryParams):
+        """Log from a pre-built LogEntryParams"""
         await self.log(
-            LogEntryParams(level=LogLevel.DEBUG, message=message, **kwargs)
+            params.level,
+            params.message,
+            event=params.event,
+            custom_event=params.custom_event,
+            metadata=params.metadata,
+            metrics=params.metrics,
+            error=params.error,
+            tags=params.tags,
+            context=params.context,
         )
 
+    async def debug(self, message: str, **kwargs):
+        """Log debug message"""
+        if _LEVEL_RANK[LogLevel.DEBUG] < self._level_rank:
+            return
+        await self.log(LogLevel.DEBUG, message, **kwargs)
+
     async def info(self, message: str, **kwargs):
         """Log info message"""
-        await self.log(
-            LogEntryParams(level=LogLevel.INFO, message=message, **kwargs)
-        )
+        if _LEVEL_RANK[LogLevel.INFO] < self._level_rank:
+            return
+        await self.log(LogLevel.INFO, message, **kwargs)
 
     async def warn(self, message: str, **kwargs):
         """Log warning message"""
-        await self.log(
-            LogEntryParams(level=LogLevel.WARN, message=message, **kwargs)
-        )
+        if _LEVEL_RANK[LogLevel.WARN] < self._level_rank:
+            return
+        await self.log(LogLevel.WARN, message, **kwargs)
 
     async def error(self, message: str, **kwargs):
         """Log error message"""
-        await self.log(
-            LogEntryParams(level=LogLevel.ERROR, message=message, **kwargs)
-        )
+        if _LEVEL_RANK[LogLevel.ERROR] < self._level_rank:
+            return
+        await self.log(LogLevel.ERROR, message, **kwargs)
 
     # Synchronous convenience methods
+    # These hand the record to the event loop that owns the adapters, so
+    # they need no running event loop and never block on adapter I/O.
+    def _enqueue(self, level: LogLevel, message: str, kwargs: Dict[str, Any]):
+        """Schedule a record for the owning event loop"""
+        self._sync.submit(self.log(level, message, **kwargs))
+
     def debug_sync(self, message: str, **kwargs):
         """Synchronous debug logging"""
-        asyncio.create_task(self.debug(message, **kwargs))
+        if _LEVEL_RANK[LogLevel.DEBUG] < self._level_rank:
+            return
+        self._enqueue(LogLevel.DEBUG, message, kwargs)
 
     def info_sync(self, message: str, **kwargs):
         """Synchronous info logging"""
-        asyncio.create_task(self.info(message, **kwargs))
+        if _LEVEL_RANK[LogLevel.INFO] < self._level_rank:
+            return
+        self._enqueue(LogLevel.INFO, message, kwargs)
 
     def warn_sync(self, message: str, **kwargs):
         """Synchronous warning logging"""
-        asyncio.create_task(self.warn(message, **kwargs))
+        if _LEVEL_RANK[LogLevel.WARN] < self._level_rank:
+            return
+        self._enqueue(LogLevel.WARN, message, kwargs)
 
     def error_sync(self, message: str, **kwargs):
         """Synchronous error logging"""
-        asyncio.create_task(self.error(message, **kwargs))
+        if _LEVEL_RANK[LogLevel.ERROR] < self._level_rank:
+            return
+        self._enqueue(LogLevel.ERROR, message, kwargs)
+
+    def flush(self):
+        """Block until all scheduled synchronous log records are written
+
+        Called from a coroutine on the owning loop this cannot wait (the
+        records need that loop to run), so it returns immediately; await
+        close() there instead.
+        """
+        pending = self._sync.snapshot()
+        if not pending:
+            return
+        running = None
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        if running is None or running is not self._sync.owner:
+            concurrent.futures.wait(pending)
 
     async def close(self):
         """Close all adapters and cleanup resources"""
+        # Let scheduled sync records land before the adapters go away
+        pending = self._sync.snapshot()
+        if pending:
+            await asyncio.gather(
+                *(asyncio.wrap_future(future) for future in pending),
+                return_exceptions=True,
+            )
         tasks = [adapter.close() for adapter in self.adapters]
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
@@ -191,48 +428,16 @@ class Logger:
         """Create a logger with additional context"""
         new_context = self.base_context
 
-        # Update context with provided values
+        # Pop the known fields; whatever remains is custom context. kwargs is
+        # a fresh dict per call, so it can be handed over without copying.
         context_update = LoggerContext(
-            correlation_id=kwargs.get("correlation_id"),
-            user_id=kwargs.get("user_id"),
-            session_id=kwargs.get("session_id"),
-            request_id=kwargs.get("request_id"),
-            trace_id=kwargs.get("trace_id"),
-            span_id=kwargs.get("span_id"),
-            custom_context={
-                k: v
-                for k, v in kwargs.items()
-                if k
-                not in [
-                    "correlation_id",
-                    "user_id",
-                    "session_id",
-                    "request_id",
-                    "trace_id",
-                    "span_id",
-                ]
-            },
+            correlation_id=kwargs.pop("correlation_id", None),
+            user_id=kwargs.pop("user_id", None),
+            session_id=kwargs.pop("session_id", None),
+            request_id=kwargs.pop("request_id", None),
+            trace_id=kwargs.pop("trace_id", None),
+            span_id=kwargs.pop("span_id", None),
+            custom_context=kwargs,
         )
 
-        merged_context = new_context.merge(context_update)
-
-        # Convert LoggerContext to LoggingContext for Smithy compatibility
-        logging_context = LoggingContext(
-            correlation_id=merged_context.correlation_id,
-            trace_id=merged_context.trace_id,
-            span_id=merged_context.span_id,
-            user_id=merged_context.user_id,
-            session_id=merged_context.session_id,
-            request_id=merged_context.request_id,
-        )
-
-        return Logger(
-            LoggerConfig(
-                service=self.service,
-                environment=self.environment,
-                adapters=self._convert_to_adapter_names(),
-                emojis=self.emojis,
-                context=logging_context,
-            ),
-            self.adapters,  # Pass current adapter instances
-        )
+        return self._clone(new_context.merge(context_update))
@@ -4,8 +4,7 @@ Core type definitions for Artissist Logger Python client
 Import and re-export ONLY generated Smithy types
 """
 
-from dataclasses import dataclass
-from typing import Optional, List
+from typing import List, NamedTuple, Optional
 
 # Import only the types used in this module and exported to other modules
 from .generated_types import (
@@ -20,9 +19,8 @@ from .generated_types import (
 
 
 # Client-specific helper types (not in Smithy schema)
-@dataclass
-class LogEntryParams:
-    """Parameters for creating a log entry"""
+class LogEntryParams(NamedTuple):
+    """Parameters for creating a log entry (immutable)"""
 
     level: LogLevel
     message: str
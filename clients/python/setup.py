@@ -61,6 +61,9 @@ setup(
         "file": [
             "aiofiles>=22.0.0",
         ],
+        "json": [
+            "orjson>=3.6.0",
+        ],
         "cloud": [
             "boto3>=1.26.0",
             "azure-monitor-opentelemetry-exporter>=1.0.0b17",
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""
+Shared fixtures for the Artissist Logger Python client tests
+"""
+
+import threading
+from typing import List, Tuple
+
+import pytest
+
+from artissist_logger import Logger
+from artissist_logger.adapters.base import LogAdapter
+from artissist_logger.generated_types import LoggerConfig
+from artissist_logger.types import LogEntry
+
+
+class RecordingAdapter(LogAdapter):
+    """Adapter that keeps every written entry and the writing thread"""
+
+    def __init__(self):
+        super().__init__({})
+        self.entries: List[LogEntry] = []
+        self.batches: List[List[Tuple[LogEntry, str]]] = []
+        self.threads: List[int] = []
+        self.closed = False
+
+    async def write(self, message: LogEntry, formatted_message: str):
+        self.entries.append(message)
+        self.threads.append(threading.get_ident())
+
+    async def write_batch(self, entries: List[Tuple[LogEntry, str]]):
+        self.batches.append(list(entries))
+        await super().write_batch(entries)
+
+    async def close(self):
+        self.closed = True
+
+    @property
+    def messages(self) -> List[str]:
+        return [entry.message for entry in self.entries]
+
+
+@pytest.fixture
+def recorder() -> RecordingAdapter:
+    return RecordingAdapter()
+
+
+@pytest.fixture
+def make_logger():
+    def make(*adapters: LogAdapter, level=None) -> Logger:
+        return Logger(
+            LoggerConfig(
+                service="test-service", environment="test", level=level
+            ),
+            adapter_instances=list(adapters),
+        )
+
+    return make
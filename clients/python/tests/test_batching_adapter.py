@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""
+Tests for BatchingAdapter
+"""
+
+import asyncio
+
+import pytest
+
+from artissist_logger.adapters.batching import BatchingAdapter
+from artissist_logger.types import LogEntry, LogLevel
+
+
+def _entry(message: str) -> LogEntry:
+    return LogEntry(
+        timestamp="2024-01-01T00:00:00",
+        level=LogLevel.INFO,
+        message=message,
+        service="test-service",
+    )
+
+
+class SlowRecorder:
+    """Wraps a recorder so write_batch yields to the loop mid-write"""
+
+    def __init__(self, recorder):
+        self.recorder = recorder
+        self.needs_formatting = recorder.needs_formatting
+
+    async def write_batch(self, entries):
+        await asyncio.sleep(0.01)
+        if self.recorder.closed:
+            raise RuntimeError("write after close")
+        await self.recorder.write_batch(entries)
+
+    async def close(self):
+        await self.recorder.close()
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_is_full(recorder):
+    adapter = BatchingAdapter(
+        recorder, {"batch_size": 3, "batch_timeout_us": 10_000_000}
+    )
+
+    for index in range(7):
+        await adapter.write(_entry(f"m{index}"), "")
+
+    assert [len(batch) for batch in recorder.batches] == [3, 3]
+    assert recorder.messages == ["m0", "m1", "m2", "m3", "m4", "m5"]
+
+    await adapter.close()
+    assert recorder.messages[-1] == "m6"
+
+
+@pytest.mark.asyncio
+async def test_flushes_partial_batch_after_timeout(recorder):
+    adapter = BatchingAdapter(
+        recorder, {"batch_size": 100, "batch_timeout_us": 1000}
+    )
+
+    await adapter.write(_entry("lonely"), "")
+    assert not recorder.entries
+
+    await asyncio.sleep(0.05)
+    assert recorder.messages == ["lonely"]
+    assert len(recorder.batches) == 1
+
+    await adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_close_drains_buffer_and_closes_delegate(recorder):
+    adapter = BatchingAdapter(
+        recorder, {"batch_size": 100, "batch_timeout_us": 10_000_000}
+    )
+
+    await adapter.write(_entry("a"), "")
+    await adapter.write(_entry("b"), "")
+    await adapter.close()
+
+    assert recorder.messages == ["a", "b"]
+    assert recorder.closed
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_in_flight_timer_flush(recorder):
+    adapter = BatchingAdapter(
+        SlowRecorder(recorder), {"batch_size": 100, "batch_timeout_us": 1}
+    )
+
+    await adapter.write(_entry("in flight"), "")
+    # Let the timer fire and start its (slow) delegate write; the buffer
+    # is empty by then, so close() has nothing of its own to flush
+    await asyncio.sleep(0.001)
+    await adapter.close()
+
+    assert recorder.messages == ["in flight"]
+    assert recorder.closed
+
+
+def test_lock_is_created_inside_the_running_loop(recorder):
+    adapter = BatchingAdapter(recorder, {"batch_size": 1})
+
+    async def log_once(message):
+        await adapter.write(_entry(message), "")
+
+    # Each asyncio.run uses a fresh loop; the adapter must work in both
+    asyncio.run(log_once("first loop"))
+    asyncio.run(log_once("second loop"))
+
+    assert recorder.messages == ["first loop", "second loop"]
@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""
+Tests for ConsoleAdapter output formats
+"""
+
+import json
+
+import pytest
+
+from artissist_logger.adapters.console import ConsoleAdapter
+from artissist_logger.generated_types import LoggingContext
+from artissist_logger.types import (
+    ErrorDetails,
+    LogEntry,
+    LogEvent,
+    LogLevel,
+    PerformanceMetrics,
+)
+
+
+def _entry(message: str, **kwargs) -> LogEntry:
+    return LogEntry(
+        timestamp="2024-01-01T00:00:00",
+        level=LogLevel.ERROR,
+        message=message,
+        service="test-service",
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("has_orjson", [True, False])
+async def test_json_format_emits_structured_lines(
+    capsys, monkeypatch, has_orjson
+):
+    if has_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(
+        "artissist_logger.adapters.base.HAS_ORJSON", has_orjson
+    )
+    adapter = ConsoleAdapter({"format": "json"})
+    assert not adapter.needs_formatting
+
+    await adapter.write(
+        _entry(
+            "boom",
+            event=LogEvent.ERROR_OCCURRED,
+            context=LoggingContext(correlation_id="corr-1"),
+            error=ErrorDetails(type="ValueError", message="bad"),
+            metrics=PerformanceMetrics(duration_ms=3),
+        ),
+        "",
+    )
+
+    (line,) = capsys.readouterr().out.splitlines()
+    record = json.loads(line)
+    assert record["message"] == "boom"
+    assert record["level"] == "ERROR"
+    assert record["event"] == LogEvent.ERROR_OCCURRED.value
+    assert record["context"]["correlation_id"] == "corr-1"
+    assert record["error"] == {
+        "type": "ValueError",
+        "message": "bad",
+        "stack_trace": None,
+        "code": None,
+        "context": None,
+    }
+    assert record["metrics"]["duration_ms"] == 3
+
+
+@pytest.mark.asyncio
+async def test_json_batch_writes_one_line_per_entry(capsys):
+    adapter = ConsoleAdapter({"format": "json"})
+
+    await adapter.write_batch([(_entry("a"), ""), (_entry("b"), "")])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["message"] for line in lines] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_text_format_appends_error_and_metrics(capsys):
+    adapter = ConsoleAdapter({"colors": False})
+    entry = _entry(
+        "boom",
+        error=ErrorDetails(type="ValueError", message="bad"),
+        metrics=PerformanceMetrics(duration_ms=3),
+    )
+
+    await adapter.write(entry, adapter.format_message(entry))
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].endswith("[test-service] boom")
+    assert lines[1:] == [
+        "  ERROR: ValueError: bad",
+        "  METRICS: duration_ms=3",
+    ]
@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""
+Tests for ContextManager context propagation
+"""
+
+import asyncio
+
+import pytest
+
+from artissist_logger.context import ContextManager, LoggerContext
+
+
+@pytest.fixture(autouse=True)
+def clean_context():
+    token = ContextManager.set_context(None)
+    yield
+    ContextManager.reset_context(token)
+
+
+def test_reset_context_restores_previous_value():
+    outer = LoggerContext(correlation_id="outer")
+    inner = LoggerContext(correlation_id="inner")
+
+    outer_token = ContextManager.set_context(outer)
+    inner_token = ContextManager.set_context(inner)
+    assert ContextManager.get_context() is inner
+
+    ContextManager.reset_context(inner_token)
+    assert ContextManager.get_context() is outer
+
+    ContextManager.reset_context(outer_token)
+    assert ContextManager.get_context() is None
+
+
+def test_reset_context_rejects_a_token_twice():
+    token = ContextManager.set_context(LoggerContext(correlation_id="once"))
+    ContextManager.reset_context(token)
+
+    with pytest.raises(RuntimeError):
+        ContextManager.reset_context(token)
+
+
+def test_scoped_context_nests_and_restores():
+    with ContextManager.context(correlation_id="outer", tenant="acme"):
+        with ContextManager.context(user_id="user-1") as inner:
+            assert inner.correlation_id == "outer"
+            assert inner.user_id == "user-1"
+            assert inner.custom_context == {"tenant": "acme"}
+        current = ContextManager.get_context()
+        assert current.correlation_id == "outer"
+        assert current.user_id is None
+
+    assert ContextManager.get_context() is None
+
+
+def test_scoped_context_restores_after_exception():
+    with pytest.raises(ValueError):
+        with ContextManager.context(correlation_id="failing"):
+            raise ValueError("boom")
+
+    assert ContextManager.get_context() is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_keep_separate_contexts():
+    seen = {}
+
+    async def handle(correlation_id):
+        token = ContextManager.set_context(
+            LoggerContext(correlation_id=correlation_id)
+        )
+        try:
+            await asyncio.sleep(0)
+            seen[correlation_id] = ContextManager.get_context().correlation_id
+        finally:
+            ContextManager.reset_context(token)
+
+    await asyncio.gather(handle("a"), handle("b"), handle("c"))
+
+    assert seen == {"a": "a", "b": "b", "c": "c"}
+    assert ContextManager.get_context() is None
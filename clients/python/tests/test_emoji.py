@@ -0,0 +1,25 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""
+Tests for EmojiResolver lookups
+"""
+
+from artissist_logger.emoji import EmojiMapping, EmojiResolver
+from artissist_logger.generated_types import TYPED_EMOJI_MAPPINGS
+from artissist_logger.types import LogEvent
+
+
+def test_default_event_resolves_to_its_emoji():
+    resolver = EmojiResolver()
+
+    assert (
+        resolver.get_emoji(LogEvent.USER_AUTH)
+        == TYPED_EMOJI_MAPPINGS[LogEvent.USER_AUTH]["emoji"]
+    )
+
+
+def test_event_name_string_falls_through_to_custom_mapping():
+    resolver = EmojiResolver({"login": EmojiMapping("🔑", "Login")})
+
+    # Plain strings are not LogEvent members and must not raise
+    assert resolver.get_emoji("USER_AUTH") is None  # type: ignore[arg-type]
+    assert resolver.get_emoji("USER_AUTH", "login") == "🔑"  # type: ignore
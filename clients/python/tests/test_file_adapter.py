@@ -0,0 +1,228 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""
+Tests for FileAdapter's buffered and unbuffered write paths
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from artissist_logger import LoggerFactory
+from artissist_logger.adapters import file as file_module
+from artissist_logger.adapters.file import FileAdapter
+from artissist_logger.types import LogEntry, LogLevel, PerformanceMetrics
+
+
+def _entry(message: str, **kwargs) -> LogEntry:
+    return LogEntry(
+        timestamp="2024-01-01T00:00:00",
+        level=LogLevel.INFO,
+        message=message,
+        service="test-service",
+        **kwargs,
+    )
+
+
+def _buffered(tmp_path, **config) -> FileAdapter:
+    return FileAdapter(
+        {
+            "file_path": str(tmp_path / "app.log"),
+            "buffer_bytes": 1024 * 1024,
+            "flush_interval_ms": 60_000,
+            **config,
+        }
+    )
+
+
+async def _write(adapter: FileAdapter, message: str, **kwargs):
+    entry = _entry(message, **kwargs)
+    await adapter.write(entry, adapter.format_message(entry))
+
+
+@pytest.mark.asyncio
+async def test_records_stay_buffered_until_close(tmp_path):
+    adapter = _buffered(tmp_path)
+    log_file = tmp_path / "app.log"
+
+    await _write(adapter, "first")
+    await _write(adapter, "second")
+    assert not log_file.exists() or log_file.read_text() == ""
+
+    await adapter.close()
+    lines = log_file.read_text().splitlines()
+    assert [line.rsplit(" ", 1)[-1] for line in lines] == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_is_written_immediately(tmp_path):
+    adapter = _buffered(tmp_path, buffer_bytes=1)
+
+    await _write(adapter, "now")
+
+    assert (tmp_path / "app.log").read_text().endswith("now\n")
+    await adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_timer_flushes_partial_buffer(tmp_path):
+    adapter = _buffered(tmp_path, flush_interval_ms=5)
+
+    await _write(adapter, "eventually")
+    await asyncio.sleep(0.05)
+
+    assert (tmp_path / "app.log").read_text().endswith("eventually\n")
+    await adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_partial_os_write_is_retried(tmp_path, monkeypatch):
+    real_write = os.write
+    calls = []
+
+    def short_write(fd, data):
+        # Accept at most 7 bytes per call, like a pipe or a full disk
+        calls.append(len(data))
+        return real_write(fd, bytes(data[:7]))
+
+    monkeypatch.setattr(file_module.os, "write", short_write)
+    adapter = _buffered(tmp_path)
+
+    await _write(adapter, "a message much longer than seven bytes")
+    adapter.flush()
+    monkeypatch.undo()
+
+    assert len(calls) > 1
+    text = (tmp_path / "app.log").read_text()
+    assert text.endswith("a message much longer than seven bytes\n")
+    assert adapter._fd_size == len(text.encode("utf-8"))
+    await adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_rotates_once_tracked_size_reaches_threshold(tmp_path):
+    # Rotate as soon as the file holds 100 bytes
+    adapter = _buffered(
+        tmp_path, rotate=True, max_size_mb=100 / (1024 * 1024), max_files=3
+    )
+    log_file = tmp_path / "app.log"
+    rotated = tmp_path / "app.1.log"
+
+    await _write(adapter, "x" * 120)
+    adapter.flush()
+    assert not rotated.exists()
+
+    await _write(adapter, "after rotation")
+    adapter.flush()
+
+    assert rotated.read_text().endswith("x" * 120 + "\n")
+    assert log_file.read_text().endswith("after rotation\n")
+    assert adapter._fd_size == log_file.stat().st_size
+    await adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_size_tracking_starts_from_existing_file(tmp_path):
+    log_file = tmp_path / "app.log"
+    log_file.write_text("y" * 200 + "\n")
+    adapter = _buffered(tmp_path, rotate=True, max_size_mb=100 / (1024 * 1024))
+
+    await _write(adapter, "triggers rotation")
+    adapter.flush()
+
+    assert (tmp_path / "app.1.log").read_text() == "y" * 200 + "\n"
+    assert log_file.read_text().endswith("triggers rotation\n")
+    await adapter.close()
+
+
+@pytest.mark.asyncio
+async def test_write_batch_appends_to_buffer(tmp_path):
+    adapter = _buffered(tmp_path)
+    entries = [_entry(f"m{index}") for index in range(3)]
+
+    await adapter.write_batch(
+        [(entry, adapter.format_message(entry)) for entry in entries]
+    )
+    await adapter.close()
+
+    lines = (tmp_path / "app.log").read_text().splitlines()
+    assert [line.rsplit(" ", 1)[-1] for line in lines] == ["m0", "m1", "m2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("has_orjson", [True, False])
+async def test_json_format_writes_one_object_per_line(
+    tmp_path, monkeypatch, has_orjson
+):
+    if has_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(
+        "artissist_logger.adapters.base.HAS_ORJSON", has_orjson
+    )
+    adapter = _buffered(tmp_path, format="json")
+
+    await adapter.write(
+        _entry("structured", metrics=PerformanceMetrics(duration_ms=12)), ""
+    )
+    await adapter.close()
+
+    (line,) = (tmp_path / "app.log").read_text().splitlines()
+    record = json.loads(line)
+    assert record["message"] == "structured"
+    assert record["level"] == "INFO"
+    assert record["metrics"]["duration_ms"] == 12
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_async", [True, False])
+async def test_unbuffered_write_appends_utf8_records(tmp_path, use_async):
+    adapter = FileAdapter(
+        {"file_path": str(tmp_path / "app.log"), "async": use_async}
+    )
+
+    await _write(adapter, "first")
+    await _write(adapter, "café ✨", metrics=PerformanceMetrics(duration_ms=5))
+
+    lines = (tmp_path / "app.log").read_text(encoding="utf-8").splitlines()
+    assert lines[0].endswith("first")
+    assert lines[1].endswith("café ✨")
+    assert json.loads(lines[2].split("METRICS: ", 1)[1])["duration_ms"] == 5
+    await adapter.close()
+
+
+def test_buffered_records_are_flushed_at_exit_without_close(tmp_path):
+    script = """
+import asyncio, sys
+from artissist_logger.adapters.file import FileAdapter
+from artissist_logger.types import LogEntry, LogLevel
+
+adapter = FileAdapter({
+    "file_path": sys.argv[1],
+    "buffer_bytes": 1024 * 1024,
+    "flush_interval_ms": 60_000,
+})
+entry = LogEntry(
+    timestamp="2024-01-01T00:00:00", level=LogLevel.INFO,
+    message="unclosed", service="test-service",
+)
+asyncio.run(adapter.write(entry, adapter.format_message(entry)))
+"""
+    log_file = tmp_path / "app.log"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    subprocess.run(
+        [sys.executable, "-c", script, str(log_file)], check=True, env=env
+    )
+
+    assert log_file.read_text().endswith("unclosed\n")
+
+
+def test_backend_logger_file_output_is_unbuffered(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logger = LoggerFactory.create_backend_logger("svc", "development")
+
+    (adapter,) = [a for a in logger.adapters if isinstance(a, FileAdapter)]
+    assert adapter.buffer_bytes == 0
@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""
+Tests for minimum-level gating
+"""
+
+import pytest
+
+from artissist_logger import LoggerFactory, LogLevel
+from artissist_logger.generated_types import AdapterName, AgentLoggerConfig
+
+
+@pytest.mark.asyncio
+async def test_records_below_minimum_level_are_dropped(recorder, make_logger):
+    logger = make_logger(recorder, level=LogLevel.WARN)
+
+    await logger.debug("debug")
+    await logger.info("info")
+    await logger.warn("warn")
+    await logger.error("error")
+    await logger.log(LogLevel.TRACE, "trace")
+    await logger.log(LogLevel.FATAL, "fatal")
+
+    assert recorder.messages == ["warn", "error", "fatal"]
+
+
+@pytest.mark.asyncio
+async def test_without_level_everything_is_emitted(recorder, make_logger):
+    logger = make_logger(recorder)
+
+    await logger.log(LogLevel.TRACE, "trace")
+    await logger.debug("debug")
+
+    assert recorder.messages == ["trace", "debug"]
+
+
+def test_sync_methods_respect_minimum_level(recorder, make_logger):
+    logger = make_logger(recorder, level=LogLevel.ERROR)
+
+    logger.debug_sync("debug")
+    logger.info_sync("info")
+    logger.warn_sync("warn")
+    logger.error_sync("error")
+    logger.flush()
+
+    assert recorder.messages == ["error"]
+
+
+def test_is_enabled_for(make_logger):
+    logger = make_logger(level=LogLevel.INFO)
+
+    assert not logger.is_enabled_for(LogLevel.DEBUG)
+    assert logger.is_enabled_for(LogLevel.INFO)
+    assert logger.is_enabled_for(LogLevel.ERROR)
+
+
+@pytest.mark.parametrize("name", ["INFO", "info"])
+def test_level_names_are_coerced(make_logger, name):
+    logger = make_logger(level=name)
+
+    assert logger.level is LogLevel.INFO
+    assert not logger.is_enabled_for(LogLevel.DEBUG)
+
+
+def test_unknown_level_name_is_rejected(make_logger):
+    with pytest.raises(ValueError, match="Unknown log level"):
+        make_logger(level="LOUD")
+
+
+@pytest.mark.asyncio
+async def test_child_loggers_keep_the_minimum_level(recorder, make_logger):
+    child = make_logger(recorder, level=LogLevel.WARN).with_context(
+        user_id="user-1"
+    )
+
+    await child.info("dropped")
+    await child.warn("kept")
+
+    assert recorder.messages == ["kept"]
+
+
+def test_factories_forward_level(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    loggers = [
+        LoggerFactory.create_frontend_logger(
+            "web", "test", level=LogLevel.WARN
+        ),
+        LoggerFactory.create_backend_logger(
+            "api", "test", adapters=["console"], level=LogLevel.WARN
+        ),
+        LoggerFactory.create_agent_logger(
+            AgentLoggerConfig(
+                agent_id="a1",
+                agent_type="observer",
+                environment="test",
+                adapters=[AdapterName.CONSOLE],
+                level=LogLevel.WARN,
+            )
+        ),
+        LoggerFactory.create_infrastructure_logger(
+            "db", "test", adapters=["console"], level=LogLevel.WARN
+        ),
+    ]
+
+    for logger in loggers:
+        assert logger.level is LogLevel.WARN
+        assert not logger.is_enabled_for(LogLevel.INFO)
@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""
+Tests for the synchronous (*_sync) logging path
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from artissist_logger.adapters.batching import BatchingAdapter
+from artissist_logger.context import ContextManager
+
+
+def test_sync_logging_without_event_loop(recorder, make_logger):
+    logger = make_logger(recorder)
+
+    logger.info_sync("first")
+    logger.warn_sync("second")
+    logger.flush()
+
+    assert recorder.messages == ["first", "second"]
+    # Written by the fallback loop thread, not the caller
+    assert threading.get_ident() not in recorder.threads
+
+
+def test_sync_logging_carries_caller_context(recorder, make_logger):
+    logger = make_logger(recorder)
+
+    with ContextManager.context(correlation_id="corr-sync"):
+        logger.info_sync("scoped")
+    logger.flush()
+
+    assert recorder.entries[0].context.correlation_id == "corr-sync"
+
+
+@pytest.mark.asyncio
+async def test_mixed_sync_and_async_share_the_owning_loop(
+    recorder, make_logger
+):
+    logger = make_logger(recorder)
+    loop_thread = threading.get_ident()
+
+    await logger.info("async")
+    logger.info_sync("sync on loop")
+    await asyncio.get_running_loop().run_in_executor(
+        None, logger.info_sync, "sync from worker thread"
+    )
+    await logger.close()
+
+    assert sorted(recorder.messages) == [
+        "async",
+        "sync from worker thread",
+        "sync on loop",
+    ]
+    assert set(recorder.threads) == {loop_thread}
+
+
+@pytest.mark.asyncio
+async def test_sync_records_from_threads_drive_batching_timer(
+    recorder, make_logger
+):
+    batching = BatchingAdapter(
+        recorder, {"batch_size": 100, "batch_timeout_us": 1000}
+    )
+    logger = make_logger(batching)
+
+    await logger.info("async")
+    await asyncio.get_running_loop().run_in_executor(
+        None, logger.info_sync, "sync"
+    )
+    # Give the forwarded record and the batch timer time to run
+    for _ in range(50):
+        if len(recorder.entries) == 2:
+            break
+        await asyncio.sleep(0.005)
+
+    assert sorted(recorder.messages) == ["async", "sync"]
+    assert set(recorder.threads) == {threading.get_ident()}
+    await logger.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_on_owning_loop_does_not_block(recorder, make_logger):
+    logger = make_logger(recorder)
+
+    await logger.info("claim loop")
+    logger.info_sync("pending")
+    # Waiting here would deadlock; the record lands once the loop runs
+    logger.flush()
+    await logger.close()
+
+    assert recorder.messages == ["claim loop", "pending"]
+
+
+def test_each_logger_keeps_its_own_owning_loop(recorder, make_logger):
+    first_recorder, second_recorder = recorder, type(recorder)()
+    first, second = make_logger(first_recorder), make_logger(second_recorder)
+    claimed = threading.Barrier(2)
+    loop_threads = {}
+
+    async def serve(logger, name):
+        loop_threads[name] = threading.get_ident()
+        await logger.info("claim loop")
+        # Both loops are now owned; log from a worker thread on each
+        await asyncio.get_running_loop().run_in_executor(None, claimed.wait)
+        await asyncio.get_running_loop().run_in_executor(
+            None, logger.info_sync, "from worker"
+        )
+        await logger.close()
+
+    threads = [
+        threading.Thread(target=asyncio.run, args=(serve(first, "first"),)),
+        threading.Thread(target=asyncio.run, args=(serve(second, "second"),)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert first_recorder.messages == ["claim loop", "from worker"]
+    assert second_recorder.messages == ["claim loop", "from worker"]
+    assert set(first_recorder.threads) == {loop_threads["first"]}
+    assert set(second_recorder.threads) == {loop_threads["second"]}
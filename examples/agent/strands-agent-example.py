@@ -3,17 +3,71 @@
 """
 Agent processing integration example using Strands Agents with Artissist Logger
 This example demonstrates how to integrate the logger into Strands agent processing workflows
+
+Set LOG_LEVEL=DEBUG to include the per-step debug records, and
+LOG_FORMAT=json to emit one JSON object per record instead of text.
+SIMULATE_LATENCY=0 skips the simulated model and tool latencies.
 """
 
 import asyncio
+import functools
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import struct
+import sys
 import time
-import uuid
 import json
 import traceback
-from typing import Dict, Any, List, Optional
+from collections import ChainMap, deque
+from typing import Callable, Dict, Any, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Event emojis, plus the ready-made "<emoji> " prefixes used by _log
+_EMOJI_MAP: Dict[str, str] = {
+    "AGENT_PROCESSING": "🤖",
+    "CONVERSATION_EVENT": "💬",
+    "ERROR_OCCURRED": "🐛",
+    "WARNING_ISSUED": "⚠️",
+    "PERFORMANCE_METRIC": "⚡",
+    "USER_AUTH": "👤",
+    "SYSTEM_START": "🚀",
+    "ANALYTICS_EVENT": "📊",
+    "EXTERNAL_SERVICE": "🌐",
+}
+_EMOJI_PREFIX: Dict[str, str] = {k: f"{v} " for k, v in _EMOJI_MAP.items()}
+
+# Severities matching the stdlib logging levels; the threshold comes from
+# LOG_LEVEL
+_LEVELS: Dict[str, int] = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40}
+
+# Stdlib spellings accepted for LOG_LEVEL alongside the Artissist names
+_LEVEL_ALIASES: Dict[str, str] = {"WARNING": "WARN", "CRITICAL": "ERROR"}
+
+# Demo sleeps standing in for model and API latency; SIMULATE_LATENCY=0
+# skips them so the pipeline itself can be profiled
+_SIMULATE_LATENCY = os.environ.get("SIMULATE_LATENCY", "1") == "1"
+
+# Structured fields copied verbatim into JSON records
+_RECORD_FIELDS = ("event", "error", "metrics", "metadata")
+
+
+def _dumps_line(record: Dict[str, Any]) -> str:
+    """Serialize a record as one JSON line, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(
+            record, default=str, option=orjson.OPT_APPEND_NEWLINE
+        ).decode()
+    return json.dumps(record, default=str) + "\n"
+
 
 # Mock Strands Agent SDK structures (would be imported from actual SDK)
 class ObservationType(Enum):
@@ -22,7 +76,13 @@ class ObservationType(Enum):
     SYSTEM_EVENT = "system_event"
 
 
-@dataclass
+# Compact, immutable records; slots need Python 3.10+
+_RECORD_OPTIONS: Dict[str, Any] = (
+    {"slots": True, "frozen": True} if sys.version_info >= (3, 10) else {"frozen": True}
+)
+
+
+@dataclass(**_RECORD_OPTIONS)
 class Observation:
     id: str
     type: ObservationType
@@ -34,7 +94,7 @@ class Observation:
     confidence: float = 1.0
 
 
-@dataclass
+@dataclass(**_RECORD_OPTIONS)
 class ProcessingResult:
     observation_id: str
     entities: List[Dict[str, Any]]
@@ -45,39 +105,289 @@ class ProcessingResult:
     extracted_data: Dict[str, Any]
 
 
+# One alternation over every entity keyword (substring semantics), so the
+# content is scanned in a single finditer pass. The lookahead keeps matches
+# zero-width, so overlapping keywords ("paintime") are all found, as with
+# separate ``in`` checks.
+_ENTITY_RE = re.compile(
+    "(?=(?P<project>project)"
+    "|(?P<time>time|minutes|hours)"
+    "|(?P<material>paint|canvas|brush))"
+)
+
+
+# Random 8-hex-digit id suffixes, refilled 256 at a time from one urandom call
+_ID_POOL: "deque[str]" = deque()
+
+
+def _next_id(prefix: str) -> str:
+    """Return a short random id such as ``proj_1a2b3c4d``"""
+    if not _ID_POOL:
+        words = struct.unpack("256I", os.urandom(256 * 4))
+        _ID_POOL.extend(f"{word:08x}" for word in words)
+    return f"{prefix}_{_ID_POOL.popleft()}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize(content: str) -> str:
+    """Clean and lower-case raw observation content"""
+    return content.strip().lower()
+
+
+def _match_entities(content: str) -> List[Dict[str, Any]]:
+    """Rule-based entity matches for normalized content
+
+    The matches are memoized; each caller gets its own copies to mutate.
+    """
+    return [dict(entity) for entity in _cached_entities(content)]
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_entities(content: str) -> Tuple[Dict[str, Any], ...]:
+    """Shared, memoized result behind _match_entities; never mutate it"""
+    first_match: Dict[str, "re.Match[str]"] = {}
+    for match in _ENTITY_RE.finditer(content):
+        first_match.setdefault(match.lastgroup, match)
+        if len(first_match) == 3:
+            break
+
+    # Emitted in a fixed order regardless of where each keyword appears
+    entities = []
+    project = first_match.get("project")
+    if project:
+        entities.append(
+            {
+                "type": "project",
+                "value": "artwork project",
+                "confidence": 0.9,
+                "start_pos": project.start("project"),
+                "end_pos": project.end("project"),
+            }
+        )
+
+    if "time" in first_match:
+        entities.append(
+            {
+                "type": "time_duration",
+                "value": "30 minutes",
+                "confidence": 0.8,
+                "extracted_from": "contextual inference",
+            }
+        )
+
+    if "material" in first_match:
+        entities.append(
+            {
+                "type": "material",
+                "value": "painting supplies",
+                "confidence": 0.85,
+                "category": "art_materials",
+            }
+        )
+
+    return tuple(entities)
+
+
+class _AgentFormatter(logging.Formatter):
+    """Render agent records as bracketed text lines or JSON objects"""
+
+    def __init__(self, as_json: bool = False):
+        super().__init__()
+        self.as_json = as_json
+
+    def format(self, record: logging.LogRecord) -> str:
+        agent: "ArtissistAgentLogger" = record.agent
+        level: str = record.agent_level
+        fields: Dict[str, Any] = record.fields
+        message = record.getMessage()
+        correlation_id = agent._correlation_id
+
+        if self.as_json:
+            data = {
+                "level": level,
+                "agent_id": agent.agent_id,
+                "msg": message,
+                "correlation_id": correlation_id,
+            }
+            for field in _RECORD_FIELDS:
+                if field in fields:
+                    data[field] = fields[field]
+            error = data.get("error")
+            if error and "exc_info" in error:
+                error = dict(error)
+                error["traceback"] = "".join(
+                    traceback.format_exception(*error.pop("exc_info"))
+                )
+                data["error"] = error
+            return _dumps_line(data)
+
+        event = fields.get("event", "")
+        prefix = _EMOJI_PREFIX.get(event, "") if agent.emojis else ""
+
+        # Assemble the whole record so the handler emits it with one write
+        parts = [
+            agent._level_prefix[level]
+            + prefix
+            + message
+            + " | correlation_id="
+            + correlation_id
+            + "\n"
+        ]
+
+        if fields.get("error"):
+            error = fields["error"]
+            parts.append(
+                f"  ERROR: {error.get('type', 'Unknown')}: {error.get('message', '')}\n"
+            )
+
+        if fields.get("metrics"):
+            metrics = fields["metrics"]
+            if "duration_ms" in metrics:
+                parts.append(f"  METRICS: duration={metrics['duration_ms']}ms\n")
+
+        if fields.get("metadata"):
+            metadata = fields["metadata"]
+            if "extracted_entities" in metadata:
+                parts.append(
+                    f"  EXTRACTED: {metadata['extracted_entities']} entities\n"
+                )
+
+        return "".join(parts)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue records untouched so formatting happens on the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _AgentStreamHandler(logging.StreamHandler):
+    """Write formatted records, flushing only for errors
+
+    The formatter supplies trailing newlines, and stdout stays block-buffered
+    so consecutive records share write() calls.
+    """
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.stream.write(self.format(record))
+            # Keep errors visible immediately even when stdout is buffered
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+# Agent records go through stdlib logging: callers pay for a level check and
+# a queue put, while a QueueListener thread formats and writes them
+_LOG_QUEUE: "queue.Queue[logging.LogRecord]" = queue.Queue()
+_AGENT_LOGGER = logging.getLogger("artissist.agent")
+
+
+def _level_from_env() -> int:
+    """Threshold named by LOG_LEVEL, falling back to INFO for unknown names"""
+    name = os.environ.get("LOG_LEVEL", "INFO").strip().upper()
+    return _LEVELS.get(_LEVEL_ALIASES.get(name, name), _LEVELS["INFO"])
+
+
+def _configure_logging() -> Callable[[], None]:
+    """Route agent records to stdout and return the matching teardown
+
+    Called from main() so that importing this module leaves stdout and the
+    logging tree untouched.
+    """
+    # Log output shares sys.stdout with the demo's print() calls so lines
+    # stay in order; switching off line buffering lets one write() carry
+    # many records
+    line_buffering = getattr(sys.stdout, "line_buffering", None)
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
+    _AGENT_LOGGER.setLevel(_level_from_env())
+    _AGENT_LOGGER.propagate = False
+    queue_handler = _DeferredQueueHandler(_LOG_QUEUE)
+    _AGENT_LOGGER.addHandler(queue_handler)
+
+    stream_handler = _AgentStreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        _AgentFormatter(as_json=os.environ.get("LOG_FORMAT", "text").lower() == "json")
+    )
+    listener = logging.handlers.QueueListener(_LOG_QUEUE, stream_handler)
+    listener.start()
+
+    def teardown():
+        # stop() writes whatever is still queued before returning
+        listener.stop()
+        _AGENT_LOGGER.removeHandler(queue_handler)
+        sys.stdout.flush()
+        if line_buffering is not None:
+            sys.stdout.reconfigure(line_buffering=line_buffering)
+
+    return teardown
+
+
 # Mock Artissist Logger for Agent (would be imported from actual Python client)
 class ArtissistAgentLogger:
-    """Mock implementation of what the Python Agent Logger would look like"""
+    """Mock implementation of what the Python Agent Logger would look like
+
+    Records are handed to a background QueueListener thread for formatting
+    and output; ``await ArtissistAgentLogger.aflush()`` waits for it to catch
+    up before writing anything else to stdout.
+    """
 
     def __init__(
         self,
         agent_id: str,
         environment: str,
         emojis: bool = False,
-        context: dict = None,
+        context: Optional[Mapping[str, Any]] = None,
         session_id: str = None,
     ):
         self.agent_id = agent_id
         self.environment = environment
         self.emojis = emojis
-        self.context = context or {}
+        self.context = context if context is not None else {}
         self.session_id = session_id
+        # _log only ever reads the correlation id, so resolve it once
+        self._correlation_id = self.context.get("correlation_id", "N/A")
+        self._pylog = _AGENT_LOGGER.getChild(agent_id)
+        # "[LEVEL] [AGENT:id] " never changes for this logger, so build it once
+        self._level_prefix = {
+            level: f"[{level}] [AGENT:{agent_id}] " for level in _LEVELS
+        }
+
+    # Messages take %-style args, formatted only once the level check passes
+    def info(self, message: str, *args, **kwargs):
+        self._log("INFO", message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs):
-        self._log("INFO", message, **kwargs)
+    def debug(self, message: str, *args, **kwargs):
+        self._log("DEBUG", message, *args, **kwargs)
 
-    def debug(self, message: str, **kwargs):
-        self._log("DEBUG", message, **kwargs)
+    def error(self, message: str, *args, **kwargs):
+        self._log("ERROR", message, *args, **kwargs)
 
-    def error(self, message: str, **kwargs):
-        self._log("ERROR", message, **kwargs)
+    def warn(self, message: str, *args, **kwargs):
+        self._log("WARN", message, *args, **kwargs)
 
-    def warn(self, message: str, **kwargs):
-        self._log("WARN", message, **kwargs)
+    def event(self, level: str, message: str, event: str, *args, **fields):
+        """Log an event whose keyword fields become the record's metadata
+
+        Shortcut for ``_log(level, message, event=..., metadata={...})``
+        that reuses the keyword dict instead of building a nested one.
+        """
+        if not self._pylog.isEnabledFor(_LEVELS[level]):
+            return
+        self._log(level, message, *args, event=event, metadata=fields)
+
+    def isEnabledFor(self, level: str) -> bool:
+        """Check whether a message at the given level would be emitted"""
+        return self._pylog.isEnabledFor(_LEVELS[level])
 
     def child(self, additional_context: dict):
         """Create child logger with additional context"""
-        merged_context = {**self.context, **additional_context}
+        # Layer the child's context over the parent's instead of copying it
+        merged_context = ChainMap(additional_context, self.context)
         return ArtissistAgentLogger(
             self.agent_id,
             self.environment,
@@ -86,44 +396,26 @@ class ArtissistAgentLogger:
             self.session_id,
         )
 
-    def _log(self, level: str, message: str, **kwargs):
-        event = kwargs.get("event", "")
-        emoji_map = {
-            "AGENT_PROCESSING": "🤖",
-            "CONVERSATION_EVENT": "💬",
-            "ERROR_OCCURRED": "🐛",
-            "WARNING_ISSUED": "⚠️",
-            "PERFORMANCE_METRIC": "⚡",
-            "USER_AUTH": "👤",
-            "SYSTEM_START": "🚀",
-            "ANALYTICS_EVENT": "📊",
-            "EXTERNAL_SERVICE": "🌐",
-        }
-
-        prefix = (
-            f"{emoji_map.get(event, '')} " if self.emojis and event in emoji_map else ""
-        )
-        correlation_id = self.context.get("correlation_id", "N/A")
-
-        print(
-            f"[{level}] [AGENT:{self.agent_id}] {prefix}{message} | correlation_id={correlation_id}"
+    def _log(self, level: str, message: str, *args, **kwargs):
+        levelno = _LEVELS[level]
+        if not self._pylog.isEnabledFor(levelno):
+            return
+        self._pylog.log(
+            levelno,
+            message,
+            *args,
+            extra={"agent": self, "agent_level": level, "fields": kwargs},
         )
 
-        if kwargs.get("error"):
-            error = kwargs["error"]
-            print(
-                f"  ERROR: {error.get('type', 'Unknown')}: {error.get('message', '')}"
-            )
-
-        if kwargs.get("metrics"):
-            metrics = kwargs["metrics"]
-            if "duration_ms" in metrics:
-                print(f"  METRICS: duration={metrics['duration_ms']}ms")
+    @staticmethod
+    async def aflush():
+        """Wait until the listener thread has written every queued record"""
+        await asyncio.get_running_loop().run_in_executor(None, _LOG_QUEUE.join)
 
-        if kwargs.get("metadata"):
-            metadata = kwargs["metadata"]
-            if "extracted_entities" in metadata:
-                print(f"  EXTRACTED: {metadata['extracted_entities']} entities")
+    @classmethod
+    async def aclose(cls):
+        """Flush queued records; main() stops the listener itself"""
+        await cls.aflush()
 
 
 class ArtissistLoggerFactory:
@@ -164,7 +456,8 @@ class ConversationProcessorAgent:
 
         # Log agent initialization
         self.logger.info(
-            f"Conversation processor agent initialized: {agent_id}",
+            "Conversation processor agent initialized: %s",
+            agent_id,
             event="SYSTEM_START",
             metadata={
                 "agent_type": "conversation_processor",
@@ -178,7 +471,8 @@ class ConversationProcessorAgent:
 
     async def process_observation(self, observation: Observation) -> ProcessingResult:
         """Main processing method for conversation observations"""
-        start_time = time.time()
+        start_time = time.perf_counter()
+        obs_type = observation.type.value
 
         # Create observation-specific logger with additional context
         obs_logger = self.logger.child(
@@ -191,11 +485,12 @@ class ConversationProcessorAgent:
         )
 
         obs_logger.info(
-            f"Processing observation: {observation.type.value}",
+            "Processing observation: %s",
+            obs_type,
             event="AGENT_PROCESSING",
             metadata={
                 "operation": "process_observation",
-                "observation_type": observation.type.value,
+                "observation_type": obs_type,
                 "confidence": observation.confidence,
                 "content_length": len(observation.content),
             },
@@ -205,25 +500,34 @@ class ConversationProcessorAgent:
             # Step 1: Content preprocessing
             processed_content = await self._preprocess_content(observation, obs_logger)
 
-            # Step 2: Entity extraction
-            entities = await self._extract_entities(processed_content, obs_logger)
+            # Steps 2 and 3: Entity extraction and context retrieval are
+            # independent, so run them concurrently
+            entities, contextual_data = await asyncio.gather(
+                self._extract_entities(processed_content, obs_logger),
+                self._integrate_context(observation, obs_logger),
+            )
 
-            # Step 3: Intent recognition
+            # Step 4: Intent recognition
             intentions = await self._recognize_intentions(
                 processed_content, entities, obs_logger
             )
 
-            # Step 4: Context integration
-            contextual_data = await self._integrate_context(
-                observation, entities, obs_logger
-            )
+            # Attach the extracted entities to the integrated context
+            groups: Dict[str, List[Dict[str, Any]]] = {}
+            for entity in entities:
+                groups.setdefault(entity["type"], []).append(entity)
+            contextual_data["extracted_structured_data"] = {
+                "projects": groups.get("project", []),
+                "materials": groups.get("material", []),
+                "time_entries": groups.get("time_duration", []),
+            }
 
             # Step 5: Tool calls if needed
             tool_calls = await self._execute_tool_calls(
                 intentions, contextual_data, obs_logger
             )
 
-            processing_time_ms = (time.time() - start_time) * 1000
+            processing_time_ms = (time.perf_counter() - start_time) * 1000
 
             result = ProcessingResult(
                 observation_id=observation.id,
@@ -236,7 +540,7 @@ class ConversationProcessorAgent:
             )
 
             obs_logger.info(
-                f"Observation processing completed successfully",
+                "Observation processing completed successfully",
                 event="AGENT_PROCESSING",
                 metadata={
                     "operation": "process_observation_complete",
@@ -258,7 +562,7 @@ class ConversationProcessorAgent:
                 event="ANALYTICS_EVENT",
                 metadata={
                     "metric_type": "processing_performance",
-                    "observation_type": observation.type.value,
+                    "observation_type": obs_type,
                     "processing_time_ms": processing_time_ms,
                     "entities_extracted": len(entities),
                     "success": True,
@@ -268,18 +572,20 @@ class ConversationProcessorAgent:
             return result
 
         except Exception as e:
-            processing_time_ms = (time.time() - start_time) * 1000
+            processing_time_ms = (time.perf_counter() - start_time) * 1000
 
             obs_logger.error(
-                f"Observation processing failed: {str(e)}",
+                "Observation processing failed: %s",
+                e,
                 event="ERROR_OCCURRED",
                 error={
                     "type": type(e).__name__,
                     "message": str(e),
-                    "traceback": traceback.format_exc(),
+                    # Formatted by the logger only if the record is emitted
+                    "exc_info": sys.exc_info(),
                     "context": {
                         "observation_id": observation.id,
-                        "observation_type": observation.type.value,
+                        "observation_type": obs_type,
                         "processing_step": "unknown",
                     },
                 },
@@ -295,28 +601,29 @@ class ConversationProcessorAgent:
         self, observation: Observation, logger: ArtissistAgentLogger
     ) -> str:
         """Preprocess observation content"""
-        logger.debug(
-            "Preprocessing observation content",
-            event="AGENT_PROCESSING",
-            metadata={
-                "operation": "preprocess_content",
-                "original_length": len(observation.content),
-            },
-        )
+        if logger.isEnabledFor("DEBUG"):
+            logger.event(
+                "DEBUG",
+                "Preprocessing observation content",
+                "AGENT_PROCESSING",
+                operation="preprocess_content",
+                original_length=len(observation.content),
+            )
 
         # Simulate preprocessing (cleaning, normalization, etc.)
-        await asyncio.sleep(0.05)
-
-        processed = observation.content.strip().lower()
-
-        logger.debug(
-            "Content preprocessing completed",
-            event="AGENT_PROCESSING",
-            metadata={
-                "operation": "preprocess_content_complete",
-                "processed_length": len(processed),
-            },
-        )
+        if _SIMULATE_LATENCY:
+            await asyncio.sleep(0.05)
+
+        processed = _normalize(observation.content)
+
+        if logger.isEnabledFor("DEBUG"):
+            logger.event(
+                "DEBUG",
+                "Content preprocessing completed",
+                "AGENT_PROCESSING",
+                operation="preprocess_content_complete",
+                processed_length=len(processed),
+            )
 
         return processed
 
@@ -324,56 +631,30 @@ class ConversationProcessorAgent:
         self, content: str, logger: ArtissistAgentLogger
     ) -> List[Dict[str, Any]]:
         """Extract entities from processed content"""
-        logger.debug(
-            "Starting entity extraction",
-            event="AGENT_PROCESSING",
-            metadata={"operation": "extract_entities", "content_length": len(content)},
-        )
-
-        # Simulate LLM call for entity extraction
-        await asyncio.sleep(0.15)
-
-        # Mock entity extraction results
-        entities = []
-        if "project" in content:
-            entities.append(
-                {
-                    "type": "project",
-                    "value": "artwork project",
-                    "confidence": 0.9,
-                    "start_pos": content.find("project"),
-                    "end_pos": content.find("project") + len("project"),
-                }
-            )
-
-        if "time" in content or "minutes" in content or "hours" in content:
-            entities.append(
-                {
-                    "type": "time_duration",
-                    "value": "30 minutes",
-                    "confidence": 0.8,
-                    "extracted_from": "contextual inference",
-                }
-            )
-
-        if "paint" in content or "canvas" in content or "brush" in content:
-            entities.append(
-                {
-                    "type": "material",
-                    "value": "painting supplies",
-                    "confidence": 0.85,
-                    "category": "art_materials",
-                }
+        if logger.isEnabledFor("DEBUG"):
+            logger.event(
+                "DEBUG",
+                "Starting entity extraction",
+                "AGENT_PROCESSING",
+                operation="extract_entities",
+                content_length=len(content),
             )
 
-        logger.info(
-            f"Entity extraction completed: found {len(entities)} entities",
-            event="AGENT_PROCESSING",
-            metadata={
-                "operation": "extract_entities_complete",
-                "entities_found": len(entities),
-                "entity_types": [e["type"] for e in entities],
-            },
+        # Simulate LLM call for entity extraction
+        if _SIMULATE_LATENCY:
+            await asyncio.sleep(0.15)
+
+        # Mock entity extraction results, memoized on the normalized content
+        entities = _match_entities(content)
+
+        logger.event(
+            "INFO",
+            "Entity extraction completed: found %d entities",
+            "AGENT_PROCESSING",
+            len(entities),
+            operation="extract_entities_complete",
+            entities_found=len(entities),
+            entity_types=[e["type"] for e in entities],
         )
 
         return entities
@@ -382,65 +663,65 @@ class ConversationProcessorAgent:
         self, content: str, entities: List[Dict[str, Any]], logger: ArtissistAgentLogger
     ) -> List[str]:
         """Recognize user intentions from content and entities"""
-        logger.debug(
-            "Starting intention recognition",
-            event="AGENT_PROCESSING",
-            metadata={
-                "operation": "recognize_intentions",
-                "entities_count": len(entities),
-            },
-        )
+        if logger.isEnabledFor("DEBUG"):
+            logger.event(
+                "DEBUG",
+                "Starting intention recognition",
+                "AGENT_PROCESSING",
+                operation="recognize_intentions",
+                entities_count=len(entities),
+            )
 
         # Simulate intention recognition
-        await asyncio.sleep(0.1)
+        if _SIMULATE_LATENCY:
+            await asyncio.sleep(0.1)
 
         intentions = []
+        entity_types = {e["type"] for e in entities}
 
         # Rule-based intention detection (would be ML-based in practice)
-        if any(e["type"] == "project" for e in entities):
+        if "project" in entity_types:
             intentions.append("create_project")
 
         if "finished" in content or "completed" in content:
             intentions.append("mark_complete")
 
-        if any(e["type"] == "time_duration" for e in entities):
+        if "time_duration" in entity_types:
             intentions.append("log_time")
 
-        if any(e["type"] == "material" for e in entities):
+        if "material" in entity_types:
             intentions.append("track_materials")
 
         if not intentions:
             intentions.append("general_logging")
 
-        logger.info(
-            f"Intention recognition completed: identified {len(intentions)} intentions",
-            event="AGENT_PROCESSING",
-            metadata={
-                "operation": "recognize_intentions_complete",
-                "intentions": intentions,
-            },
+        logger.event(
+            "INFO",
+            "Intention recognition completed: identified %d intentions",
+            "AGENT_PROCESSING",
+            len(intentions),
+            operation="recognize_intentions_complete",
+            intentions=intentions,
         )
 
         return intentions
 
     async def _integrate_context(
-        self,
-        observation: Observation,
-        entities: List[Dict[str, Any]],
-        logger: ArtissistAgentLogger,
+        self, observation: Observation, logger: ArtissistAgentLogger
     ) -> Dict[str, Any]:
         """Integrate observation with session context"""
-        logger.debug(
-            "Integrating session context",
-            event="AGENT_PROCESSING",
-            metadata={
-                "operation": "integrate_context",
-                "session_id": observation.session_id,
-            },
-        )
+        if logger.isEnabledFor("DEBUG"):
+            logger.event(
+                "DEBUG",
+                "Integrating session context",
+                "AGENT_PROCESSING",
+                operation="integrate_context",
+                session_id=observation.session_id,
+            )
 
         # Simulate context retrieval and integration
-        await asyncio.sleep(0.08)
+        if _SIMULATE_LATENCY:
+            await asyncio.sleep(0.08)
 
         # Mock contextual data
         contextual_data = {
@@ -454,23 +735,15 @@ class ConversationProcessorAgent:
                 "preferred_medium": "digital",
                 "active_projects": 3,
             },
-            "extracted_structured_data": {
-                "projects": [e for e in entities if e["type"] == "project"],
-                "materials": [e for e in entities if e["type"] == "material"],
-                "time_entries": [e for e in entities if e["type"] == "time_duration"],
-            },
         }
 
-        logger.info(
+        logger.event(
+            "INFO",
             "Context integration completed",
-            event="AGENT_PROCESSING",
-            metadata={
-                "operation": "integrate_context_complete",
-                "context_elements": len(contextual_data),
-                "current_project": contextual_data["session_context"][
-                    "current_project"
-                ],
-            },
+            "AGENT_PROCESSING",
+            operation="integrate_context_complete",
+            context_elements=len(contextual_data),
+            current_project=contextual_data["session_context"]["current_project"],
         )
 
         return contextual_data
@@ -482,85 +755,86 @@ class ConversationProcessorAgent:
         logger: ArtissistAgentLogger,
     ) -> List[Dict[str, Any]]:
         """Execute tool calls based on recognized intentions"""
-        logger.debug(
-            f"Executing tool calls for {len(intentions)} intentions",
-            event="AGENT_PROCESSING",
-            metadata={"operation": "execute_tool_calls", "intentions": intentions},
-        )
-
-        tool_calls = []
-
-        for intention in intentions:
-            tool_call_start = time.time()
-
-            if intention == "create_project":
-                result = await self._call_create_project_tool(contextual_data, logger)
-                tool_calls.append(
-                    {
-                        "tool": "create_project",
-                        "intention": intention,
-                        "result": result,
-                        "duration_ms": (time.time() - tool_call_start) * 1000,
-                    }
-                )
+        if logger.isEnabledFor("DEBUG"):
+            logger.event(
+                "DEBUG",
+                "Executing tool calls for %d intentions",
+                "AGENT_PROCESSING",
+                len(intentions),
+                operation="execute_tool_calls",
+                intentions=intentions,
+            )
 
-            elif intention == "log_time":
-                result = await self._call_log_time_tool(contextual_data, logger)
-                tool_calls.append(
-                    {
-                        "tool": "log_time",
-                        "intention": intention,
-                        "result": result,
-                        "duration_ms": (time.time() - tool_call_start) * 1000,
-                    }
-                )
+        # Tools share no state, so dispatch them all before awaiting any
+        tools = {
+            "create_project": self._call_create_project_tool,
+            "log_time": self._call_log_time_tool,
+            "track_materials": self._call_track_materials_tool,
+        }
+        pending = [
+            (intention, tools[intention](contextual_data, logger))
+            for intention in intentions
+            if intention in tools
+        ]
+        timed_results = await asyncio.gather(
+            *(self._timed_tool_call(call) for _, call in pending)
+        )
 
-            elif intention == "track_materials":
-                result = await self._call_track_materials_tool(contextual_data, logger)
-                tool_calls.append(
-                    {
-                        "tool": "track_materials",
-                        "intention": intention,
-                        "result": result,
-                        "duration_ms": (time.time() - tool_call_start) * 1000,
-                    }
-                )
+        tool_calls = [
+            {
+                "tool": intention,
+                "intention": intention,
+                "result": result,
+                "duration_ms": duration_ms,
+            }
+            for (intention, _), (result, duration_ms) in zip(pending, timed_results)
+        ]
 
         if tool_calls:
-            logger.info(
-                f"Tool execution completed: {len(tool_calls)} tools called",
-                event="AGENT_PROCESSING",
-                metadata={
-                    "operation": "execute_tool_calls_complete",
-                    "tools_called": [tc["tool"] for tc in tool_calls],
-                    "total_tools": len(tool_calls),
-                },
+            logger.event(
+                "INFO",
+                "Tool execution completed: %d tools called",
+                "AGENT_PROCESSING",
+                len(tool_calls),
+                operation="execute_tool_calls_complete",
+                tools_called=[tc["tool"] for tc in tool_calls],
+                total_tools=len(tool_calls),
             )
-        else:
-            logger.debug(
+        elif logger.isEnabledFor("DEBUG"):
+            logger.event(
+                "DEBUG",
                 "No tool calls required",
-                event="AGENT_PROCESSING",
-                metadata={"operation": "execute_tool_calls_complete"},
+                "AGENT_PROCESSING",
+                operation="execute_tool_calls_complete",
             )
 
         return tool_calls
 
+    @staticmethod
+    async def _timed_tool_call(call) -> Tuple[Dict[str, Any], float]:
+        """Await a tool call, returning its result and duration in ms"""
+        tool_call_start = time.perf_counter()
+        result = await call
+        return result, (time.perf_counter() - tool_call_start) * 1000
+
     async def _call_create_project_tool(
         self, contextual_data: Dict[str, Any], logger: ArtissistAgentLogger
     ) -> Dict[str, Any]:
         """Simulate project creation tool call"""
-        logger.debug(
-            "Calling create_project tool",
-            event="EXTERNAL_SERVICE",
-            metadata={"tool": "create_project"},
-        )
+        if logger.isEnabledFor("DEBUG"):
+            logger.debug(
+                "Calling create_project tool",
+                event="EXTERNAL_SERVICE",
+                metadata={"tool": "create_project"},
+            )
 
         # Simulate API call
-        await asyncio.sleep(0.2)
+        if _SIMULATE_LATENCY:
+            await asyncio.sleep(0.2)
 
         result = {
             "success": True,
-            "project_id": f"proj_{uuid.uuid4().hex[:8]}",
+            "project_id": _next_id("proj"),
             "created_at": time.time(),
         }
 
@@ -580,13 +854,15 @@ class ConversationProcessorAgent:
         self, contextual_data: Dict[str, Any], logger: ArtissistAgentLogger
     ) -> Dict[str, Any]:
         """Simulate time logging tool call"""
-        logger.debug(
-            "Calling log_time tool",
-            event="EXTERNAL_SERVICE",
-            metadata={"tool": "log_time"},
-        )
+        if logger.isEnabledFor("DEBUG"):
+            logger.debug(
+                "Calling log_time tool",
+                event="EXTERNAL_SERVICE",
+                metadata={"tool": "log_time"},
+            )
 
-        await asyncio.sleep(0.1)
+        if _SIMULATE_LATENCY:
+            await asyncio.sleep(0.1)
 
         time_entries = contextual_data.get("extracted_structured_data", {}).get(
             "time_entries", []
@@ -595,7 +871,7 @@ class ConversationProcessorAgent:
         result = {
             "success": True,
             "time_logged_minutes": 30,  # Would extract from entities
-            "entry_id": f"time_{uuid.uuid4().hex[:8]}",
+            "entry_id": _next_id("time"),
         }
 
         logger.info(
@@ -614,13 +890,15 @@ class ConversationProcessorAgent:
         self, contextual_data: Dict[str, Any], logger: ArtissistAgentLogger
     ) -> Dict[str, Any]:
         """Simulate material tracking tool call"""
-        logger.debug(
-            "Calling track_materials tool",
-            event="EXTERNAL_SERVICE",
-            metadata={"tool": "track_materials"},
-        )
+        if logger.isEnabledFor("DEBUG"):
+            logger.debug(
+                "Calling track_materials tool",
+                event="EXTERNAL_SERVICE",
+                metadata={"tool": "track_materials"},
+            )
 
-        await asyncio.sleep(0.05)
+        if _SIMULATE_LATENCY:
+            await asyncio.sleep(0.05)
 
         materials = contextual_data.get("extracted_structured_data", {}).get(
             "materials", []
@@ -629,7 +907,7 @@ class ConversationProcessorAgent:
         result = {
             "success": True,
             "materials_tracked": len(materials),
-            "tracking_id": f"mat_{uuid.uuid4().hex[:8]}",
+            "tracking_id": _next_id("mat"),
         }
 
         logger.info(
@@ -647,7 +925,13 @@ class ConversationProcessorAgent:
 
 # Session Manager with logging
 class SessionManager:
-    """Manages conversation sessions with logging"""
+    """Manages conversation sessions with logging
+
+    Ended sessions are tombstoned with an ``ended_at`` timestamp and dropped
+    by a periodic compaction pass rather than deleted one at a time.
+    """
+
+    compaction_interval_seconds = 60.0
 
     def __init__(self):
         self.logger = ArtissistLoggerFactory.create_agent_logger(
@@ -659,6 +943,8 @@ class SessionManager:
         )
 
         self.active_sessions = {}
+        self._active_count = 0
+        self._compaction_task: Optional["asyncio.Task[None]"] = None
 
         self.logger.info(
             "Session Manager initialized",
@@ -669,7 +955,8 @@ class SessionManager:
     async def start_session(self, user_id: str, session_id: str) -> Dict[str, Any]:
         """Start a new conversation session"""
         self.logger.info(
-            f"Starting new session: {session_id}",
+            "Starting new session: %s",
+            session_id,
             event="CONVERSATION_EVENT",
             metadata={
                 "operation": "start_session",
@@ -678,23 +965,32 @@ class SessionManager:
             },
         )
 
+        if self._compaction_task is None:
+            self._compaction_task = asyncio.create_task(self._compact_periodically())
+
+        previous = self.active_sessions.get(session_id)
+        if previous is None or "ended_at" in previous:
+            self._active_count += 1
+
+        now = time.time()
         session_data = {
             "session_id": session_id,
             "user_id": user_id,
-            "started_at": time.time(),
+            "started_at": now,
             "observations_processed": 0,
-            "last_activity": time.time(),
+            "last_activity": now,
         }
 
         self.active_sessions[session_id] = session_data
 
         self.logger.info(
-            f"Session started successfully: {session_id}",
+            "Session started successfully: %s",
+            session_id,
             event="CONVERSATION_EVENT",
             metadata={
                 "operation": "session_started",
                 "session_id": session_id,
-                "active_sessions_count": len(self.active_sessions),
+                "active_sessions_count": self._active_count,
             },
         )
 
@@ -702,12 +998,14 @@ class SessionManager:
 
     async def end_session(self, session_id: str):
         """End a conversation session"""
-        if session_id in self.active_sessions:
-            session_data = self.active_sessions[session_id]
-            duration = time.time() - session_data["started_at"]
+        session_data = self.active_sessions.get(session_id)
+        if session_data is not None and "ended_at" not in session_data:
+            ended_at = time.time()
+            duration = ended_at - session_data["started_at"]
 
             self.logger.info(
-                f"Ending session: {session_id}",
+                "Ending session: %s",
+                session_id,
                 event="CONVERSATION_EVENT",
                 metadata={
                     "operation": "end_session",
@@ -717,12 +1015,43 @@ class SessionManager:
                 },
             )
 
-            del self.active_sessions[session_id]
+            session_data["ended_at"] = ended_at
+            self._active_count -= 1
+
+    def compact(self):
+        """Drop tombstoned sessions from the session table"""
+        self.active_sessions = {
+            session_id: session_data
+            for session_id, session_data in self.active_sessions.items()
+            if "ended_at" not in session_data
+        }
+
+    async def _compact_periodically(self):
+        """Background task compacting the session table on an interval"""
+        while True:
+            await asyncio.sleep(self.compaction_interval_seconds)
+            self.compact()
+
+    async def close(self):
+        """Stop background compaction and drop ended sessions"""
+        if self._compaction_task is not None:
+            self._compaction_task.cancel()
+            self._compaction_task = None
+        self.compact()
 
 
 # Example usage and demo
 async def main():
     """Demonstrate agent processing with Artissist Logger"""
+    stop_logging = _configure_logging()
+    try:
+        await _run_demo()
+    finally:
+        stop_logging()
+
+
+async def _run_demo():
+    """Process sample observations in one session; logging is set up by main"""
 
     print("🤖 Artissist Logger Agent Processing Demo")
     print("=" * 50)
@@ -732,65 +1061,73 @@ async def main():
     session_manager = SessionManager()
 
     # Start demo session
-    session_id = f"sess_{uuid.uuid4().hex[:8]}"
-    user_id = f"user_{uuid.uuid4().hex[:8]}"
+    session_id = _next_id("sess")
+    user_id = _next_id("user")
 
     await session_manager.start_session(user_id, session_id)
 
     # Create sample observations
+    created_at = time.time()
     observations = [
         Observation(
-            id=f"obs_{uuid.uuid4().hex[:8]}",
+            id=_next_id("obs"),
             type=ObservationType.CONVERSATION,
             content="I just finished working on my digital art project for 2 hours using Photoshop and my Wacom tablet",
             metadata={"source": "voice_input", "language": "en"},
-            timestamp=time.time(),
+            timestamp=created_at,
             session_id=session_id,
             user_id=user_id,
             confidence=0.95,
         ),
         Observation(
-            id=f"obs_{uuid.uuid4().hex[:8]}",
+            id=_next_id("obs"),
             type=ObservationType.USER_INPUT,
             content="I want to create a new painting project with acrylic paints on canvas",
             metadata={"source": "text_input", "language": "en"},
-            timestamp=time.time(),
+            timestamp=created_at,
             session_id=session_id,
             user_id=user_id,
             confidence=0.9,
         ),
         Observation(
-            id=f"obs_{uuid.uuid4().hex[:8]}",
+            id=_next_id("obs"),
             type=ObservationType.CONVERSATION,
             content="The color mixing took about 30 minutes and I used titanium white and ultramarine blue",
             metadata={"source": "voice_input", "language": "en"},
-            timestamp=time.time(),
+            timestamp=created_at,
             session_id=session_id,
             user_id=user_id,
             confidence=0.88,
         ),
     ]
 
-    # Process each observation
+    # Process all observations concurrently
+    outcomes = await asyncio.gather(
+        *[agent.process_observation(o) for o in observations],
+        return_exceptions=True,
+    )
+    await ArtissistAgentLogger.aflush()
+
     results = []
-    for i, observation in enumerate(observations, 1):
-        print(f"\n--- Processing Observation {i}/3 ---")
+    for i, (observation, outcome) in enumerate(zip(observations, outcomes), 1):
+        print(f"\n--- Observation {i}/{len(observations)} ---")
 
-        try:
-            result = await agent.process_observation(observation)
-            results.append(result)
+        if isinstance(outcome, Exception):
+            print(f"❌ Failed to process observation {observation.id}: {str(outcome)}")
+            continue
 
-            print(f"✅ Processed observation {observation.id}")
-            print(f"   Entities: {len(result.entities)}")
-            print(f"   Intentions: {len(result.intentions)}")
-            print(f"   Tool calls: {len(result.tool_calls)}")
-            print(f"   Processing time: {result.processing_time_ms:.2f}ms")
+        results.append(outcome)
 
-        except Exception as e:
-            print(f"❌ Failed to process observation {observation.id}: {str(e)}")
+        print(f"✅ Processed observation {observation.id}")
+        print(f"   Entities: {len(outcome.entities)}")
+        print(f"   Intentions: {len(outcome.intentions)}")
+        print(f"   Tool calls: {len(outcome.tool_calls)}")
+        print(f"   Processing time: {outcome.processing_time_ms:.2f}ms")
 
     # End session
     await session_manager.end_session(session_id)
+    await session_manager.close()
+    await ArtissistAgentLogger.aclose()
 
     print(f"\n🎉 Demo completed! Processed {len(results)} observations successfully")
     print(
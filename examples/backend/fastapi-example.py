@@ -5,44 +5,374 @@ Backend API integration example using FastAPI with Artissist Logger
 This example demonstrates how to integrate artissist-logger into a Python FastAPI backend
 """
 
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
+import hmac
+import itertools
 import time
-import uuid
 import os
 import asyncio
+import json
+import secrets
 import traceback
-from fastapi import FastAPI, HTTPException, Request, Depends
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field, is_dataclass
+from enum import Enum
+from fastapi import FastAPI, HTTPException, Request, Response, Depends
+from pydantic import BaseModel, Field
+
+try:
+    import psutil
+except ImportError:  # Only /api/metrics needs it
+    psutil = None
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder for response bodies
+    orjson = None
 
 # Import the real artissist-logger
 from artissist_logger import (
     LoggerFactory,
     LogEvent,
+    LogLevel,
     LoggerContext,
-    ErrorInfo,
-    LogMetrics,
 )
+from artissist_logger.context import ContextManager
+from artissist_logger.generated_types import (
+    ErrorContext,
+    ErrorDetails,
+    PerformanceMetrics,
+)
+
+
+# Process settings, read once at import
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+DEPLOYMENT_ID = os.getenv("DEPLOYMENT_ID", "local")
+# Development features (emojis, debug logs, reload) need an explicit opt-in
+IS_DEV = os.getenv("ENVIRONMENT") == "development"
+PID = os.getpid()
+
+
+def _elapsed_ms(start_ns: int) -> int:
+    """Whole milliseconds since a perf_counter_ns() reading"""
+    return (time.perf_counter_ns() - start_ns) // 1_000_000
+
+
+_iso_second = -1
+_iso_text = ""
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO-8601, formatted at most once per second"""
+    global _iso_second, _iso_text
+    now = int(time.time())
+    if now != _iso_second:
+        _iso_second = now
+        _iso_text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+    return _iso_text
+
+
+# Latest system metrics snapshot, refreshed in the background so /api/metrics
+# never reads /proc or derives the fields on the request path
+_METRICS_SAMPLE_INTERVAL_S = 0.5
+_metrics_sample: Optional[Dict[str, Any]] = None
+_metrics_task: Optional["asyncio.Task[None]"] = None
+
+
+async def _sample_metrics():
+    """Refresh the cached system metrics sample until cancelled"""
+    global _metrics_sample
+    while True:
+        memory = psutil.virtual_memory()
+        _metrics_sample = {
+            "cpu_percent": psutil.cpu_percent(interval=None),
+            "memory_percent": memory.percent,
+            "memory_used_mb": memory.used // (1024 * 1024),
+            "memory_total_mb": memory.total // (1024 * 1024),
+        }
+        await asyncio.sleep(_METRICS_SAMPLE_INTERVAL_S)
+
+
+# Log records queued by ArtissistLoggerWrapper, drained by one background task
+_LOG_QUEUE_MAX = 10_000
+# Batch size follows a moving average of the backlog seen at each wakeup:
+# small batches when traffic is light, up to 512 records under load
+_DRAIN_BATCH_MIN = 8
+_DRAIN_BATCH_MAX = 512
+_DRAIN_EMA_ALPHA = 0.2
+# Items are (logger, level, message, args, kwargs); None is the shutdown
+# sentinel
+_log_queue: Optional[asyncio.Queue] = None
+_drain_task: Optional["asyncio.Task[None]"] = None
+
+
+class _DeferredTrace:
+    """An exception and its traceback as of the except block, unformatted"""
+
+    __slots__ = ("exc", "tb")
+
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+        # Pinned now: re-raising prepends outer frames to exc.__traceback__
+        self.tb = exc.__traceback__
+
+    def format(self) -> str:
+        return "".join(traceback.format_exception(type(self.exc), self.exc, self.tb))
+
+
+def _lazy_trace(exc: BaseException) -> _DeferredTrace:
+    """Capture an exception for a stack trace formatted by the drain task
+
+    Nothing is walked or formatted on the request path; records that are
+    never written never pay for the trace.
+    """
+    return _DeferredTrace(exc)
+
+
+def _format_stack_trace(kwargs: Dict[str, Any]):
+    """Render a deferred stack trace in a queued record's error, if any"""
+    error = kwargs.get("error")
+    trace = getattr(error, "stack_trace", None)
+    if isinstance(trace, _DeferredTrace):
+        error.stack_trace = trace.format()
+
+
+def _interpolate(message: str, args: tuple) -> str:
+    """%-format a record's message, as logging.LogRecord.getMessage does
+
+    A format string that does not match its args (or an arg whose __str__
+    raises) must not cost the record or stop the drain task, so the raw
+    message is kept and the failure is noted in it instead.
+    """
+    if not args:
+        return message
+    try:
+        return message % args
+    except Exception as e:
+        failure = f"{type(e).__name__}: {e}"
+        return f"{message} [log formatting failed: {failure}; args={args!r}]"
+
+
+async def _drain_logs(queue: asyncio.Queue):
+    """Write queued log records in batches until the shutdown sentinel"""
+    backlog_ema = 0.0
+    while True:
+        item = await queue.get()
+        backlog_ema += _DRAIN_EMA_ALPHA * (queue.qsize() + 1 - backlog_ema)
+        batch_target = min(
+            max(int(backlog_ema * 0.7), _DRAIN_BATCH_MIN), _DRAIN_BATCH_MAX
+        )
+
+        batch = []
+        stopping = item is None
+        if not stopping:
+            batch.append(item)
+            while len(batch) < batch_target:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+        for _, _, _, _, kwargs in batch:
+            _format_stack_trace(kwargs)
+        await asyncio.gather(
+            *(
+                getattr(target, level)(_interpolate(message, args), **kwargs)
+                for target, level, message, args, kwargs in batch
+            ),
+            return_exceptions=True,
+        )
+        for _ in range(len(batch) + stopping):
+            queue.task_done()
+
+        if stopping:
+            return
+
+
+# Info and debug records logged while a request is in flight are collected
+# here and written as part of the request's single summary record; warnings
+# and errors are still written on their own, as they happen.
+# Items are (level, message, args, duration_ms, kwargs), where kwargs holds
+# every other keyword the record was logged with.
+_request_events: ContextVar[Optional[List[tuple]]] = ContextVar(
+    "request_log_events", default=None
+)
+_COALESCED_LEVELS = frozenset({"debug", "info"})
+
+
+def _event_fields(duration_ms: Optional[int], kwargs: Dict[str, Any]):
+    """The structured fields of one collected event, in logging order"""
+    if duration_ms is not None:
+        yield "duration_ms", duration_ms
+    for key, value in kwargs.items():
+        if value is None:
+            continue
+        if isinstance(getattr(value, "stack_trace", None), _DeferredTrace):
+            value.stack_trace = value.stack_trace.format()
+        yield key, value
+
+
+def _summarize_events(events: List[tuple]) -> List[Dict[str, Any]]:
+    """Collected request events as dicts, for the summary's metadata"""
+    return [
+        {
+            "level": level,
+            "message": _interpolate(message, args),
+            **dict(_event_fields(duration_ms, kwargs)),
+        }
+        for level, message, args, duration_ms, kwargs in events
+    ]
+
+
+def _render_value(value: Any) -> Any:
+    """Compact text form of an event field for text-format output"""
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value):
+        return {k: v for k, v in asdict(value).items() if v is not None}
+    return value
+
+
+class _EventLines:
+    """Collected request events, rendered as indented lines when formatted
+
+    Passed as a %-arg of the summary record, so the text is only built by
+    whoever interpolates the message (normally the drain task).
+    """
+
+    __slots__ = ("events",)
+
+    def __init__(self, events: List[tuple]):
+        self.events = events
+
+    def __str__(self) -> str:
+        lines = []
+        for level, message, args, duration_ms, kwargs in self.events:
+            line = f"\n  - [{level.upper()}] {_interpolate(message, args)}"
+            fields = ", ".join(
+                f"{key}={_render_value(value)}"
+                for key, value in _event_fields(duration_ms, kwargs)
+            )
+            lines.append(f"{line} ({fields})" if fields else line)
+        return "".join(lines)
+
+
+def _fold_events(
+    message: str, args: tuple, metadata: Optional[Dict[str, Any]], events
+) -> tuple:
+    """Attach collected events to a summary record's message or metadata
+
+    Text output never renders metadata, so the events are only nested
+    there when every adapter writes JSON; otherwise they become extra
+    lines of the summary message.
+    """
+    if not events:
+        return message, args, metadata
+    if _STRUCTURED_LOGS:
+        return message, args, {**(metadata or {}), "events": _summarize_events(events)}
+    return message + "%s", (*args, _EventLines(events)), metadata
+
+
+# Wrapper method names mapped to client log levels
+_LEVEL_BY_NAME = {
+    "debug": LogLevel.DEBUG,
+    "info": LogLevel.INFO,
+    "warn": LogLevel.WARN,
+    "error": LogLevel.ERROR,
+}
 
 
 # Remove the mock implementation - using real artissist-logger now
 class ArtissistLoggerWrapper:
-    """Wrapper to provide a convenient interface that matches the FastAPI dependency injection pattern"""
+    """Wrapper to provide a convenient interface that matches the FastAPI dependency injection pattern
+
+    Once the app has started, calls only enqueue the record; the drain task
+    performs formatting and adapter I/O off the request path. Messages take
+    %-style args, interpolated only for records that pass the level gate.
+    Inside a request, info and debug records are folded into the request's
+    summary record (see _request_events).
+    """
 
     def __init__(self, logger):
         self.logger = logger
 
-    async def info(self, message: str, **kwargs):
-        await self.logger.info(message, **kwargs)
+    def is_enabled(self, level: str) -> bool:
+        """Check whether a message at the given level would be emitted"""
+        return self.logger.is_enabled_for(_LEVEL_BY_NAME[level])
+
+    async def _submit(
+        self, level: str, message: str, args: tuple, kwargs: Dict[str, Any]
+    ):
+        if not self.logger.is_enabled_for(_LEVEL_BY_NAME[level]):
+            return
+
+        events = _request_events.get()
+        if events is not None and level in _COALESCED_LEVELS:
+            start_ns = kwargs.pop("start_ns", None)
+            events.append(
+                (
+                    level,
+                    message,
+                    args,
+                    None if start_ns is None else _elapsed_ms(start_ns),
+                    kwargs,
+                )
+            )
+            return
+
+        # Timings arrive as a raw perf_counter_ns() start; the metrics object
+        # is only built for records that pass the level gate
+        start_ns = kwargs.pop("start_ns", None)
+        counters = kwargs.pop("counters", None)
+        if start_ns is not None or counters is not None:
+            kwargs["metrics"] = PerformanceMetrics(
+                duration_ms=None if start_ns is None else _elapsed_ms(start_ns),
+                counters=counters,
+            )
+
+        queue = _log_queue
+        if queue is None:
+            # Not started (or already shut down): log inline
+            _format_stack_trace(kwargs)
+            await getattr(self.logger, level)(_interpolate(message, args), **kwargs)
+            return
+
+        # The drain task runs outside the request, so pin the request's
+        # context to the record now
+        kwargs.setdefault("context", ContextManager.get_context())
+        if queue.full():
+            # Drop the oldest record rather than block the request
+            queue.get_nowait()
+            queue.task_done()
+        queue.put_nowait((self.logger, level, message, args, kwargs))
+
+    async def info(self, message: str, *args, **kwargs):
+        await self._submit("info", message, args, kwargs)
 
-    async def error(self, message: str, **kwargs):
-        await self.logger.error(message, **kwargs)
+    async def error(self, message: str, *args, **kwargs):
+        await self._submit("error", message, args, kwargs)
 
-    async def warn(self, message: str, **kwargs):
-        await self.logger.warn(message, **kwargs)
+    async def warn(self, message: str, *args, **kwargs):
+        await self._submit("warn", message, args, kwargs)
 
-    async def debug(self, message: str, **kwargs):
-        await self.logger.debug(message, **kwargs)
+    async def debug(self, message: str, *args, **kwargs):
+        await self._submit("debug", message, args, kwargs)
+
+
+def _encode_json(value: Any) -> bytes:
+    """Encode a response body, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _json_response(body: Any) -> Response:
+    """A JSON response whose body is encoded here, bypassing FastAPI's encoder"""
+    return Response(content=_encode_json(body), media_type="application/json")
 
 
 # FastAPI application setup
@@ -52,31 +382,116 @@ app = FastAPI(
     version="1.0.0",
 )
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS headers that never vary for the allow-everything policy, prebuilt as
+# raw ASGI header pairs
+_CORS_RESPONSE_HEADERS = [
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"Origin"),
+]
+_CORS_PREFLIGHT_HEADERS = [
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+    *_CORS_RESPONSE_HEADERS,
+]
+
+
+class PermissiveCORSMiddleware:
+    """ASGI middleware allowing every origin, with credentials
+
+    Stands in for CORSMiddleware with allow_*=["*"]: the only per-request work
+    is one scan of the raw request headers. The origin is echoed rather than
+    sent as "*", since browsers reject the wildcard when credentials are
+    allowed. Configure appropriately for production.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = preflight_method = requested_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                preflight_method = value
+            elif name == b"access-control-request-headers":
+                requested_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and preflight_method is not None:
+            headers = [
+                (b"access-control-allow-origin", origin),
+                *_CORS_PREFLIGHT_HEADERS,
+            ]
+            if requested_headers:
+                headers.append((b"access-control-allow-headers", requested_headers))
+            await send(
+                {"type": "http.response.start", "status": 204, "headers": headers}
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            *_CORS_RESPONSE_HEADERS,
+        ]
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+app.add_middleware(PermissiveCORSMiddleware)
+
 
 # Initialize logger
 logger = LoggerFactory.create_backend_logger(
     service="artissist-backend-api",
-    environment=os.getenv("ENVIRONMENT", "development"),
-    emojis=os.getenv("ENVIRONMENT") == "development",  # Enable emojis in dev
+    environment=ENVIRONMENT,
+    emojis=IS_DEV,  # Enable emojis in dev
     context=LoggerContext(
         custom_context={
             "service_version": "1.0.0",
-            "deployment_id": os.getenv("DEPLOYMENT_ID", "local"),
+            "deployment_id": DEPLOYMENT_ID,
         }
     ),
     adapters=["console", "file"],
+    # Debug records are only emitted in development
+    level=LogLevel.DEBUG if IS_DEV else LogLevel.INFO,
 )
+# One wrapper for the whole app; per-request ids travel in ContextManager
+api_logger = ArtissistLoggerWrapper(logger)
+# Whether every adapter writes JSON (and so renders a record's metadata)
+_STRUCTURED_LOGS = all(not adapter.needs_formatting for adapter in logger.adapters)
+
+
+# Constant log metadata, shared across requests instead of rebuilt per call.
+# Treat these as read-only; the logger never mutates metadata.
+_LIST_META = {"operation": "list_projects"}
+_EMPTY_NAME_META = {"validation_error": "empty_name"}
+_METRICS_REQUEST_META = {"operation": "get_system_metrics"}
+_BUSINESS_TAGS = {
+    "environment": ENVIRONMENT,
+    "api_version": "v1",
+}
 
 
 # Pydantic models
+class LoginCredentials(BaseModel):
+    username: str = Field(..., min_length=1)
+    password: str = Field(..., min_length=1)
+
+
 class ProjectCreate(BaseModel):
     name: str
     type: str
@@ -101,111 +516,208 @@ class LogEntry(BaseModel):
     user_id: Optional[str] = None
 
 
-# Mock database
-projects_db = {}
+# Mock database, stored column-wise so reads rebuild only what they return
+@dataclass
+class ProjectsStore:
+    ids: List[str] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    types: List[str] = field(default_factory=list)
+    descriptions: List[Optional[str]] = field(default_factory=list)
+    media: List[Optional[str]] = field(default_factory=list)
+    statuses: List[str] = field(default_factory=list)
+    created_ats: List[str] = field(default_factory=list)
+    index: Dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, project: Project):
+        """Append a validated project to every column"""
+        self.index[project.id] = len(self.ids)
+        self.ids.append(project.id)
+        self.names.append(project.name)
+        self.types.append(project.type)
+        self.descriptions.append(project.description)
+        self.media.append(project.medium)
+        self.statuses.append(project.status)
+        self.created_ats.append(project.created_at)
+
+    def get_dict(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """A stored project as a plain dict, ready for the response encoder"""
+        i = self.index.get(project_id)
+        if i is None:
+            return None
+        return {
+            "id": self.ids[i],
+            "name": self.names[i],
+            "type": self.types[i],
+            "description": self.descriptions[i],
+            "medium": self.media[i],
+            "status": self.statuses[i],
+            "created_at": self.created_ats[i],
+        }
+
+    def to_json(self) -> bytes:
+        """Serialize every project straight from the columns in one call"""
+        rows = [
+            {
+                "id": i,
+                "name": n,
+                "type": t,
+                "description": d,
+                "medium": m,
+                "status": st,
+                "created_at": c,
+            }
+            for i, n, t, d, m, st, c in zip(
+                self.ids,
+                self.names,
+                self.types,
+                self.descriptions,
+                self.media,
+                self.statuses,
+                self.created_ats,
+            )
+        ]
+        return _encode_json(rows)
+
+
+projects_db = ProjectsStore()
+
+
+# Header names in the lower-case form Starlette stores them in
+_CORRELATION_ID_HEADER = "x-correlation-id"
+_USER_ID_HEADER = "x-user-id"
+_USER_AGENT_HEADER = "user-agent"
+# High-frequency paths that bypass request logging entirely
+_NO_LOG_PATHS = frozenset({"/health"})
+
+# Generated correlation ids: a random per-process nonce plus a counter, unique
+# across workers without a urandom read per request
+_BOOT_NONCE = secrets.token_hex(4)
+_next_correlation_seq = itertools.count().__next__
 
 
 # Middleware for request logging and correlation ID
 @app.middleware("http")
 async def logging_middleware(request: Request, call_next):
-    start_time = time.time()
+    # Load balancer probes are neither logged nor given a correlation id
+    if request.url.path in _NO_LOG_PATHS:
+        return await call_next(request)
 
-    # Extract or generate correlation ID
-    correlation_id = request.headers.get("x-correlation-id") or str(uuid.uuid4())
-    user_id = request.headers.get("x-user-id")
-
-    # Create request logger with correlation context
-    request_context = LoggerContext(
-        correlation_id=correlation_id,
-        user_id=user_id,
-        request_id=f"req_{int(time.time() * 1000)}",
-    )
+    start_ns = time.perf_counter_ns()
 
-    request_logger = logger.with_context(
-        correlation_id=correlation_id,
-        user_id=user_id,
-        request_id=f"req_{int(time.time() * 1000)}",
+    # Extract or generate correlation ID
+    headers = request.headers
+    correlation_id = headers.get(_CORRELATION_ID_HEADER)
+    if not correlation_id:
+        correlation_id = f"{_BOOT_NONCE}-{_next_correlation_seq():x}"
+    user_id = headers.get(_USER_ID_HEADER)
+
+    # Bind the correlation context for this request; the logger reads it at
+    # emit time
+    context_token = ContextManager.set_context(
+        LoggerContext(
+            correlation_id=correlation_id,
+            user_id=user_id,
+            request_id=f"req_{time.time_ns() // 1_000_000}",
+        )
     )
 
-    # Log incoming request
-    await request_logger.info(
-        f"Incoming request: {request.method} {request.url.path}",
-        event=LogEvent.API_REQUEST,
-        metadata={
-            "method": request.method,
-            "path": request.url.path,
-            "user_agent": request.headers.get("user-agent"),
-            "client_ip": request.client.host if request.client else None,
-        },
-    )
+    # Collect this request's info/debug records into one summary record;
+    # nothing is collected (or built) when INFO records are disabled
+    events: Optional[List[tuple]] = None
+    if api_logger.is_enabled("info"):
+        events = []
+    events_token = _request_events.set(events)
 
-    # Add logger to request state
-    request.state.logger = ArtissistLoggerWrapper(request_logger)
     request.state.correlation_id = correlation_id
-    request.state.start_time = start_time
+    request.state.start_ns = start_ns
 
     try:
         response = await call_next(request)
 
-        # Log successful response
-        duration_ms = (time.time() - start_time) * 1000
-        await request_logger.info(
-            f"Request completed: {response.status_code}",
-            event=LogEvent.API_REQUEST,
-            metrics=LogMetrics(
-                duration_ms=round(duration_ms, 2),
-                custom_metrics={"status_code": response.status_code},
-            ),
-        )
+        # One record for the whole request, carrying the collected events
+        _request_events.set(None)
+        if events is not None:
+            method = request.method
+            path = request.url.path
+            client = request.client
+            message, args, metadata = _fold_events(
+                "Request completed: %s %s %s",
+                (method, path, response.status_code),
+                {
+                    "method": method,
+                    "path": path,
+                    "user_agent": headers.get(_USER_AGENT_HEADER),
+                    "client_ip": client.host if client else None,
+                },
+                events,
+            )
+            await api_logger.info(
+                message,
+                *args,
+                event=LogEvent.API_REQUEST,
+                metadata=metadata,
+                start_ns=start_ns,
+                counters={"status_code": response.status_code},
+            )
 
         # Add correlation ID to response headers
-        response.headers["x-correlation-id"] = correlation_id
+        response.headers[_CORRELATION_ID_HEADER] = correlation_id
         return response
 
     except Exception as e:
-        # Log request error
-        duration_ms = (time.time() - start_time) * 1000
-        await request_logger.error(
-            f"Request failed: {str(e)}",
+        # Log request error, with whatever the request logged before failing
+        _request_events.set(None)
+        message, args, metadata = _fold_events("Request failed: %s", (e,), None, events)
+        await api_logger.error(
+            message,
+            *args,
             event=LogEvent.ERROR_OCCURRED,
-            error=ErrorInfo(
+            metadata=metadata,
+            error=ErrorDetails(
                 type=type(e).__name__,
                 message=str(e),
-                stack_trace=traceback.format_exc(),
+                stack_trace=_lazy_trace(e),
             ),
-            metrics=LogMetrics(duration_ms=round(duration_ms, 2)),
+            start_ns=start_ns,
         )
         raise
 
+    finally:
+        _request_events.reset(events_token)
+        ContextManager.reset_context(context_token)
+
 
 # Dependency to get request logger
-def get_logger(request: Request) -> ArtissistLoggerWrapper:
-    return request.state.logger
+def get_logger() -> ArtissistLoggerWrapper:
+    return api_logger
 
 
 # Startup event
 @app.on_event("startup")
 async def startup_event():
+    global _log_queue, _drain_task, _metrics_task
+    _log_queue = asyncio.Queue(maxsize=_LOG_QUEUE_MAX)
+    _drain_task = asyncio.create_task(_drain_logs(_log_queue))
+    if psutil is not None:
+        _metrics_task = asyncio.create_task(_sample_metrics())
+
     await logger.info(
         "Artissist Backend API starting up",
         event=LogEvent.SYSTEM_START,
         metadata={
-            "environment": os.getenv("ENVIRONMENT", "development"),
+            "environment": ENVIRONMENT,
             "version": "1.0.0",
-            "pid": os.getpid(),
+            "pid": PID,
         },
     )
 
 
 # Health check endpoint
 @app.get("/health")
-async def health_check(request_logger: ArtissistLoggerWrapper = Depends(get_logger)):
-    await request_logger.debug(
-        "Health check requested",
-        event=LogEvent.API_REQUEST,
-        metadata={"endpoint": "/health"},
-    )
-
+async def health_check():
     return {
         "status": "healthy",
         "timestamp": time.time(),
@@ -217,39 +729,42 @@ async def health_check(request_logger: ArtissistLoggerWrapper = Depends(get_logg
 # Projects endpoints
 @app.get("/api/projects", response_model=List[Project])
 async def list_projects(request_logger: ArtissistLoggerWrapper = Depends(get_logger)):
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     await request_logger.info(
         "Fetching projects list",
         event=LogEvent.DATABASE_OPERATION,
-        metadata={"operation": "list_projects"},
+        metadata=_LIST_META,
     )
 
     try:
         # Simulate database query
         await asyncio.sleep(0.1)  # Simulate DB latency
 
-        projects_list = list(projects_db.values())
+        # Encoded in one pass from the store; FastAPI's per-item validation
+        # and encoding is skipped for a returned Response (response_model
+        # still documents the schema)
+        payload = projects_db.to_json()
 
         await request_logger.info(
             "Projects retrieved successfully",
             event=LogEvent.DATABASE_OPERATION,
-            metadata={"operation": "list_projects", "count": len(projects_list)},
-            metrics=LogMetrics(duration_ms=round((time.time() - start_time) * 1000, 2)),
+            metadata={"operation": "list_projects", "count": len(projects_db)},
+            start_ns=start_ns,
         )
 
-        return projects_list
+        return Response(content=payload, media_type="application/json")
 
     except Exception as e:
         await request_logger.error(
             "Failed to retrieve projects",
             event=LogEvent.ERROR_OCCURRED,
-            error=ErrorInfo(
+            error=ErrorDetails(
                 type=type(e).__name__,
                 message=str(e),
-                context={"operation": "list_projects"},
+                context=ErrorContext(data={"operation": "list_projects"}),
             ),
-            metrics=LogMetrics(duration_ms=round((time.time() - start_time) * 1000, 2)),
+            start_ns=start_ns,
         )
         raise HTTPException(status_code=500, detail="Failed to retrieve projects")
 
@@ -259,11 +774,12 @@ async def create_project(
     project_data: ProjectCreate,
     request_logger: ArtissistLoggerWrapper = Depends(get_logger),
 ):
-    start_time = time.time()
-    project_id = f"proj_{uuid.uuid4().hex[:8]}"
+    start_ns = time.perf_counter_ns()
+    project_id = f"proj_{secrets.token_hex(4)}"
 
     await request_logger.info(
-        f"Creating new project: {project_data.name}",
+        "Creating new project: %s",
+        project_data.name,
         event=LogEvent.PROJECT_LIFECYCLE,
         metadata={
             "operation": "create_project",
@@ -278,71 +794,69 @@ async def create_project(
             await request_logger.warn(
                 "Project creation attempted with empty name",
                 event=LogEvent.WARNING_ISSUED,
-                metadata={"validation_error": "empty_name"},
+                metadata=_EMPTY_NAME_META,
             )
             raise HTTPException(status_code=400, detail="Project name cannot be empty")
 
         # Simulate database insertion
         await asyncio.sleep(0.05)  # Simulate DB write latency
 
-        # Create project
-        project = Project(
+        # Create project; every field is either validated ProjectCreate input
+        # or generated here, so skip re-validation
+        project = Project.model_construct(
             id=project_id,
             name=project_data.name,
             type=project_data.type,
             description=project_data.description,
             medium=project_data.medium,
             status="planning",
-            created_at=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            created_at=_now_iso(),
         )
 
         # Store in mock database
-        projects_db[project_id] = project
+        projects_db.add(project)
 
+        # One record carries both the lifecycle event and the business metric
         await request_logger.info(
-            f"Project created successfully: {project.name}",
+            "Project created successfully: %s",
+            project.name,
             event=LogEvent.PROJECT_LIFECYCLE,
             metadata={
                 "operation": "create_project",
                 "project_id": project_id,
                 "project_name": project.name,
-            },
-            metrics=LogMetrics(duration_ms=round((time.time() - start_time) * 1000, 2)),
-        )
-
-        # Log business metric
-        await request_logger.info(
-            "New project created",
-            event=LogEvent.BUSINESS_METRIC,
-            metadata={
-                "metric": "project_created",
-                "value": 1,
                 "project_type": project.type,
-                "tags": {
-                    "environment": os.getenv("ENVIRONMENT", "development"),
-                    "api_version": "v1",
-                },
+                "business_metric": "project_created",
+                "value": 1,
+                "tags": _BUSINESS_TAGS,
             },
+            start_ns=start_ns,
         )
 
-        return project
+        # Returning a Response skips FastAPI's response_model validation and
+        # encoding; response_model still documents the schema
+        return _json_response(projects_db.get_dict(project_id))
 
     except HTTPException:
         raise
     except Exception as e:
         await request_logger.error(
-            f"Failed to create project: {str(e)}",
+            "Failed to create project: %s",
+            e,
             event=LogEvent.ERROR_OCCURRED,
-            error=ErrorInfo(
+            error=ErrorDetails(
                 type=type(e).__name__,
                 message=str(e),
-                context={
-                    "operation": "create_project",
-                    "project_name": project_data.name,
-                    "project_type": project_data.type,
-                },
+                context=ErrorContext(
+                    data={
+                        "operation": "create_project",
+                        "project_name": project_data.name,
+                        "project_type": project_data.type,
+                    }
+                ),
+                stack_trace=_lazy_trace(e),
             ),
-            metrics=LogMetrics(duration_ms=round((time.time() - start_time) * 1000, 2)),
+            start_ns=start_ns,
         )
         raise HTTPException(status_code=500, detail="Failed to create project")
 
@@ -351,15 +865,19 @@ async def create_project(
 async def get_project(
     project_id: str, request_logger: ArtissistLoggerWrapper = Depends(get_logger)
 ):
-    await request_logger.debug(
-        f"Fetching project: {project_id}",
-        event=LogEvent.DATABASE_OPERATION,
-        metadata={"operation": "get_project", "project_id": project_id},
-    )
+    if request_logger.is_enabled("debug"):
+        await request_logger.debug(
+            "Fetching project: %s",
+            project_id,
+            event=LogEvent.DATABASE_OPERATION,
+            metadata={"operation": "get_project", "project_id": project_id},
+        )
 
-    if project_id not in projects_db:
+    project = projects_db.get_dict(project_id)
+    if project is None:
         await request_logger.warn(
-            f"Project not found: {project_id}",
+            "Project not found: %s",
+            project_id,
             event=LogEvent.WARNING_ISSUED,
             metadata={
                 "operation": "get_project",
@@ -369,92 +887,82 @@ async def get_project(
         )
         raise HTTPException(status_code=404, detail="Project not found")
 
-    project = projects_db[project_id]
-
     await request_logger.info(
-        f"Project retrieved: {project.name}",
+        "Project retrieved: %s",
+        project["name"],
         event=LogEvent.DATABASE_OPERATION,
         metadata={
             "operation": "get_project",
             "project_id": project_id,
-            "project_name": project.name,
+            "project_name": project["name"],
         },
     )
 
-    return project
+    return _json_response(project)
 
 
 # Authentication simulation endpoint
+# Demo account accepted by the simulated authentication check
+_DEMO_USERNAME = "demo"
+_DEMO_PASSWORD = b"password"
+
+
 @app.post("/api/auth/login")
 async def login(
-    credentials: dict, request_logger: ArtissistLoggerWrapper = Depends(get_logger)
+    credentials: LoginCredentials,
+    request_logger: ArtissistLoggerWrapper = Depends(get_logger),
 ):
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
+    # Missing or empty fields are rejected with a 422 during validation
+    username = credentials.username
 
     await request_logger.info(
         "User login attempt",
         event=LogEvent.USER_AUTH,
         metadata={
             "operation": "login_attempt",
-            "username": credentials.get("username", "unknown"),
+            "username": username,
         },
     )
 
     try:
-        # Simulate authentication logic
-        username = credentials.get("username")
-        password = credentials.get("password")
-
-        if not username or not password:
-            await request_logger.warn(
-                "Login attempt with missing credentials",
-                event=LogEvent.SECURITY_EVENT,
-                metadata={
-                    "security_issue": "missing_credentials",
-                    "username": username,
-                },
-            )
-            raise HTTPException(
-                status_code=400, detail="Username and password required"
-            )
-
         # Simulate authentication check
         await asyncio.sleep(0.1)  # Simulate auth service latency
 
-        if username == "demo" and password == "password":
-            user_id = f"user_{uuid.uuid4().hex[:8]}"
-            session_id = f"sess_{uuid.uuid4().hex[:8]}"
+        if username == _DEMO_USERNAME and hmac.compare_digest(
+            credentials.password.encode(), _DEMO_PASSWORD
+        ):
+            user_id = f"user_{secrets.token_hex(4)}"
+            session_id = f"sess_{secrets.token_hex(4)}"
 
             await request_logger.info(
-                f"User login successful: {username}",
+                "User login successful: %s",
+                username,
                 event=LogEvent.USER_AUTH,
                 metadata={
                     "operation": "login_success",
                     "user_id": user_id,
                     "username": username,
                 },
-                metrics=LogMetrics(
-                    duration_ms=round((time.time() - start_time) * 1000, 2)
-                ),
+                start_ns=start_ns,
             )
 
             return {
                 "user_id": user_id,
                 "session_id": session_id,
                 "username": username,
-                "token": f"token_{uuid.uuid4().hex}",
+                "token": f"token_{secrets.token_hex(16)}",
             }
         else:
             await request_logger.warn(
-                f"Login failed for user: {username}",
+                "Login failed for user: %s",
+                username,
                 event=LogEvent.SECURITY_EVENT,
                 metadata={
                     "security_issue": "invalid_credentials",
                     "username": username,
                 },
-                metrics=LogMetrics(
-                    duration_ms=round((time.time() - start_time) * 1000, 2)
-                ),
+                start_ns=start_ns,
             )
             raise HTTPException(status_code=401, detail="Invalid credentials")
 
@@ -462,12 +970,15 @@ async def login(
         raise
     except Exception as e:
         await request_logger.error(
-            f"Login system error: {str(e)}",
+            "Login system error: %s",
+            e,
             event=LogEvent.ERROR_OCCURRED,
-            error=ErrorInfo(
-                type=type(e).__name__, message=str(e), context={"operation": "login"}
+            error=ErrorDetails(
+                type=type(e).__name__,
+                message=str(e),
+                context=ErrorContext(data={"operation": "login"}),
             ),
-            metrics=LogMetrics(duration_ms=round((time.time() - start_time) * 1000, 2)),
+            start_ns=start_ns,
         )
         raise HTTPException(status_code=500, detail="Login system error")
 
@@ -475,24 +986,21 @@ async def login(
 # Performance metrics endpoint
 @app.get("/api/metrics")
 async def get_metrics(request_logger: ArtissistLoggerWrapper = Depends(get_logger)):
-    import psutil
-
-    await request_logger.debug(
-        "Performance metrics requested",
-        event=LogEvent.PERFORMANCE_METRIC,
-        metadata={"operation": "get_system_metrics"},
-    )
+    if request_logger.is_enabled("debug"):
+        await request_logger.debug(
+            "Performance metrics requested",
+            event=LogEvent.PERFORMANCE_METRIC,
+            metadata=_METRICS_REQUEST_META,
+        )
 
     try:
-        # Collect system metrics
-        cpu_percent = psutil.cpu_percent()
-        memory = psutil.virtual_memory()
+        # Read the latest background sample
+        sample = _metrics_sample
+        if sample is None:
+            raise RuntimeError("System metrics are unavailable (psutil not installed)")
 
         metrics = {
-            "cpu_percent": cpu_percent,
-            "memory_percent": memory.percent,
-            "memory_used_mb": memory.used // (1024 * 1024),
-            "memory_total_mb": memory.total // (1024 * 1024),
+            **sample,
             "projects_count": len(projects_db),
             "timestamp": time.time(),
         }
@@ -507,12 +1015,13 @@ async def get_metrics(request_logger: ArtissistLoggerWrapper = Depends(get_logge
 
     except Exception as e:
         await request_logger.error(
-            f"Failed to collect metrics: {str(e)}",
+            "Failed to collect metrics: %s",
+            e,
             event=LogEvent.ERROR_OCCURRED,
-            error=ErrorInfo(
+            error=ErrorDetails(
                 type=type(e).__name__,
                 message=str(e),
-                context={"operation": "get_metrics"},
+                context=ErrorContext(data={"operation": "get_metrics"}),
             ),
         )
         raise HTTPException(status_code=500, detail="Failed to collect metrics")
@@ -521,6 +1030,19 @@ async def get_metrics(request_logger: ArtissistLoggerWrapper = Depends(get_logge
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
+    global _log_queue, _drain_task, _metrics_task
+    if _metrics_task is not None:
+        _metrics_task.cancel()
+        _metrics_task = None
+
+    if _log_queue is not None:
+        # Flush everything queued so far, then log the rest inline
+        queue, _log_queue = _log_queue, None
+        # The queue may be full; waiting lets the drain task make room
+        await queue.put(None)
+        await _drain_task
+        _drain_task = None
+
     await logger.info(
         "Artissist Backend API shutting down",
         event=LogEvent.SYSTEM_START,  # Note: There's no SYSTEM_STOP in LogEvent enum
@@ -529,6 +1051,8 @@ async def shutdown_event():
             "total_projects_created": len(projects_db),
         },
     )
+    # Write out whatever the buffered file adapter still holds
+    await logger.close()
 
 
 if __name__ == "__main__":
@@ -542,16 +1066,20 @@ if __name__ == "__main__":
             metadata={
                 "host": "0.0.0.0",
                 "port": 8000,
-                "environment": os.getenv("ENVIRONMENT", "development"),
+                "environment": ENVIRONMENT,
             },
         )
 
     asyncio.run(log_startup())
 
+    # The default loop="auto" / http="auto" already pick uvloop and httptools
+    # when installed (pip install "uvicorn[standard]")
     uvicorn.run(
         app,
         host="0.0.0.0",
         port=8000,
         log_level="info",
-        reload=os.getenv("ENVIRONMENT") == "development",
+        # logging_middleware already records every request
+        access_log=False,
+        reload=IS_DEV,
     )
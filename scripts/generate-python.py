@@ -63,7 +63,7 @@ def generate_dataclass(shape_name: str, shape: Dict[str, Any]) -> str:
     """Generate Python dataclass"""
     members = shape.get("members", {})
 
-    result = f"@dataclass\n"
+    result = "@dataclass(**DATACLASS_OPTIONS)\n"
     result += f"class {shape_name}:\n"
     result += f'    """{shape.get("traits", {}).get("smithy.api#documentation", f"{shape_name} data structure")}"""\n\n'
 
@@ -133,6 +133,7 @@ This file is automatically generated. Do not edit directly.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
@@ -140,6 +141,11 @@ from typing import Any, Dict, List, Optional, Union
 # Document type for arbitrary JSON data
 Document = Any
 
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
 
 '''
 